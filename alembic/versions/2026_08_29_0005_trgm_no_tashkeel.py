@@ -0,0 +1,32 @@
+"""Add trigram GIN index on verses.text_no_tashkeel.
+
+`text_normalized_full` already carries a gin_trgm_ops index, but
+substring searches against the diacritic-stripped `text_no_tashkeel`
+column had no trigram index and fell back to sequential scans.
+
+Revision ID: 0005_trgm_no_tashkeel
+Revises: 0004_verse_translations
+Create Date: 2026-08-29
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0005_trgm_no_tashkeel"
+down_revision: Union[str, None] = "0004_verse_translations"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS ix_verses_text_no_tashkeel_trgm
+        ON verses USING gin (text_no_tashkeel gin_trgm_ops)
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_verses_text_no_tashkeel_trgm")
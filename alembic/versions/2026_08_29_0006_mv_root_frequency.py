@@ -0,0 +1,42 @@
+"""Add mv_root_frequency materialized view.
+
+Root frequency and the unique-root list are corpus-wide aggregates over
+the ~128k-row morphology table. Pre-aggregating them into a materialized
+view turns each request into a read of at most a few thousand rows, and
+the view only needs refreshing when MASAQ data is (re-)ingested. The
+unique index on root is required for REFRESH MATERIALIZED VIEW
+CONCURRENTLY.
+
+Revision ID: 0006_mv_root_frequency
+Revises: 0005_trgm_no_tashkeel
+Create Date: 2026-08-29
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0006_mv_root_frequency"
+down_revision: Union[str, None] = "0005_trgm_no_tashkeel"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE MATERIALIZED VIEW IF NOT EXISTS mv_root_frequency AS
+        SELECT root, COUNT(*) AS freq
+        FROM morphology
+        WHERE root IS NOT NULL
+        GROUP BY root
+    """)
+    op.execute("""
+        CREATE UNIQUE INDEX IF NOT EXISTS ix_mv_root_frequency_root
+        ON mv_root_frequency (root)
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS mv_root_frequency")
@@ -0,0 +1,52 @@
+"""Add pre-computed normalized root/lemma columns to morphology.
+
+search_by_root normalized the *query* (stripping dashes and tatweel) in
+Python, but the stored root column may itself carry dashes/tatweel, so
+equality lookups could miss rows or bypass the index. Store the
+canonical form once at ingest time and index it — including a trigram
+GIN index on root_normalized for partial-root search.
+
+Revision ID: 0007_morphology_normalized
+Revises: 0006_mv_root_frequency
+Create Date: 2026-08-29
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0007_morphology_normalized"
+down_revision: Union[str, None] = "0006_mv_root_frequency"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("morphology", sa.Column("root_normalized", sa.String(20), nullable=True))
+    op.add_column("morphology", sa.Column("lemma_normalized", sa.String(50), nullable=True))
+
+    # Backfill existing rows (tatweel is U+0640)
+    op.execute("""
+        UPDATE morphology
+        SET root_normalized = replace(replace(root, '-', ''), 'ـ', ''),
+            lemma_normalized = replace(replace(lemma, '-', ''), 'ـ', '')
+        WHERE root IS NOT NULL OR lemma IS NOT NULL
+    """)
+
+    op.create_index("ix_morphology_root_norm", "morphology", ["root_normalized"])
+    op.create_index("ix_morphology_lemma_norm", "morphology", ["lemma_normalized"])
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS ix_morphology_root_norm_trgm
+        ON morphology USING gin (root_normalized gin_trgm_ops)
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_morphology_root_norm_trgm")
+    op.drop_index("ix_morphology_lemma_norm", table_name="morphology")
+    op.drop_index("ix_morphology_root_norm", table_name="morphology")
+    op.drop_column("morphology", "lemma_normalized")
+    op.drop_column("morphology", "root_normalized")
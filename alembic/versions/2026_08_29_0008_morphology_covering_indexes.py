@@ -0,0 +1,45 @@
+"""Make the normalized root/lemma indexes covering.
+
+search_by_root / search_by_lemma filter on root_normalized /
+lemma_normalized but select only (surah_number, verse_number,
+word_number), so a plain single-column index forces a heap visit per
+matching row. INCLUDE-ing the three location columns turns those
+lookups into index-only scans.
+
+Revision ID: 0008_morphology_covering
+Revises: 0007_morphology_normalized
+Create Date: 2026-08-29
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0008_morphology_covering"
+down_revision: Union[str, None] = "0007_morphology_normalized"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_morphology_root_norm")
+    op.execute("DROP INDEX IF EXISTS ix_morphology_lemma_norm")
+    op.execute("""
+        CREATE INDEX ix_morphology_root_norm
+        ON morphology (root_normalized)
+        INCLUDE (surah_number, verse_number, word_number)
+    """)
+    op.execute("""
+        CREATE INDEX ix_morphology_lemma_norm
+        ON morphology (lemma_normalized)
+        INCLUDE (surah_number, verse_number, word_number)
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_morphology_root_norm")
+    op.execute("DROP INDEX IF EXISTS ix_morphology_lemma_norm")
+    op.create_index("ix_morphology_root_norm", "morphology", ["root_normalized"])
+    op.create_index("ix_morphology_lemma_norm", "morphology", ["lemma_normalized"])
@@ -0,0 +1,42 @@
+"""Add generated tsvector over verses.text_normalized_full.
+
+text_search_vector (migration 0003) covers text_no_tashkeel for the
+BM25 hybrid-search path, but the analysis search endpoint matches
+against text_normalized_full, whose letter unification differs — so a
+fully-normalized query cannot reliably hit the existing column. Add a
+generated tsvector over text_normalized_full with its own GIN index so
+long multi-word queries can use word-level matching instead of the
+trigram index, whose lookup cost grows with pattern length.
+
+Revision ID: 0009_text_norm_tsv
+Revises: 0008_morphology_covering
+Create Date: 2026-08-29
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0009_text_norm_tsv"
+down_revision: Union[str, None] = "0008_morphology_covering"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        ALTER TABLE verses
+        ADD COLUMN IF NOT EXISTS text_norm_tsv tsvector
+        GENERATED ALWAYS AS (to_tsvector('simple', COALESCE(text_normalized_full, ''))) STORED
+    """)
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS ix_verses_text_norm_tsv
+        ON verses USING gin (text_norm_tsv)
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_verses_text_norm_tsv")
+    op.execute("ALTER TABLE verses DROP COLUMN IF EXISTS text_norm_tsv")
@@ -0,0 +1,50 @@
+"""Stamp created_at/updated_at server-side.
+
+The models used default=datetime.utcnow — a Python-side call per
+inserted row, producing naive datetimes via a deprecated API, and
+leaving the DB columns with no default at all for raw-SQL ingestion.
+Set DEFAULT timezone('utc', now()) on every timestamp column so
+Postgres stamps rows itself (one value per statement on bulk inserts).
+timezone('utc', now()) keeps the stored values naive-UTC, matching the
+existing data in these timestamp-without-time-zone columns.
+
+Revision ID: 0010_server_side_timestamps
+Revises: 0009_text_norm_tsv
+Create Date: 2026-08-29
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0010_server_side_timestamps"
+down_revision: Union[str, None] = "0009_text_norm_tsv"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_TIMESTAMP_COLUMNS = [
+    ("surahs", "created_at"),
+    ("surahs", "updated_at"),
+    ("verses", "created_at"),
+    ("library_spaces", "created_at"),
+    ("text_sources", "created_at"),
+    ("text_sources", "updated_at"),
+    ("text_chunks", "created_at"),
+    ("verse_translations", "created_at"),
+    ("verse_embeddings", "created_at"),
+]
+
+
+def upgrade() -> None:
+    for table, column in _TIMESTAMP_COLUMNS:
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} "
+            f"SET DEFAULT timezone('utc', now())"  # nosec B608 — static identifiers
+        )
+
+
+def downgrade() -> None:
+    for table, column in _TIMESTAMP_COLUMNS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} DROP DEFAULT")  # nosec B608
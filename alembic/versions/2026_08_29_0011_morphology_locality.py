@@ -0,0 +1,41 @@
+"""Physically cluster morphology by location and add a BRIN index.
+
+Per-verse morphology queries read a contiguous handful of rows keyed by
+(surah_number, verse_number). Clustering the heap on
+ix_morphology_location gives each surah's rows physical locality (QAC
+ingestion already inserts in mushaf order, so re-ingested data stays
+clustered), and a BRIN index over the location columns — a few KB
+against the composite B-tree's several MB — lets range scans prune
+whole heap blocks.
+
+Revision ID: 0011_morphology_locality
+Revises: 0010_server_side_timestamps
+Create Date: 2026-08-29
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0011_morphology_locality"
+down_revision: Union[str, None] = "0010_server_side_timestamps"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Rewrites the table in index order and records the clustering index
+    # so a plain CLUSTER can re-apply it after future bulk loads.
+    op.execute("CLUSTER morphology USING ix_morphology_location")
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS ix_morphology_location_brin
+        ON morphology USING brin (surah_number, verse_number)
+    """)
+    op.execute("ANALYZE morphology")
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_morphology_location_brin")
+    op.execute("ALTER TABLE morphology SET WITHOUT CLUSTER")
@@ -424,6 +424,17 @@ def generate_from_verses(db_url: str) -> list[dict]:
 # ---------------------------------------------------------------------------
 
 
+def normalize_search_form(term: str | None) -> str | None:
+    """Canonical search form: strip dashes and tatweel (U+0640).
+
+    Stored alongside the display form so the API can do plain indexed
+    equality lookups without per-query normalization.
+    """
+    if term is None:
+        return None
+    return term.replace("-", "").replace("ـ", "")
+
+
 def build_verse_id_map(engine: sa.engine.Engine) -> dict[tuple[int, int], str]:
     """Build a map of (surah, verse) -> verse UUID from the verses table."""
     verse_map: dict[tuple[int, int], str] = {}
@@ -473,6 +484,8 @@ def ingest(
                 total_skipped += 1
                 continue
 
+            root = record.get("root")
+            lemma = record.get("lemma")
             row = {
                 "surah_number": record["surah_number"],
                 "verse_number": record["verse_number"],
@@ -485,8 +498,10 @@ def ingest(
                 "segment_imlaei": record.get("form"),
                 "morpheme_type": record.get("morpheme_type", "STEM"),
                 "pos_tag": record.get("pos_tag", "UNK"),
-                "root": record.get("root"),
-                "lemma": record.get("lemma"),
+                "root": root,
+                "lemma": lemma,
+                "root_normalized": normalize_search_form(root),
+                "lemma_normalized": normalize_search_form(lemma),
                 "pattern": record.get("pattern"),
                 "person": record.get("person"),
                 "gender": record.get("gender"),
@@ -516,6 +531,28 @@ def ingest(
     if total_skipped:
         print(f"  Skipped (no matching verse): {total_skipped:,}")
 
+    refresh_root_frequency(engine)
+
+
+def refresh_root_frequency(engine: sa.engine.Engine) -> None:
+    """
+    Refresh the mv_root_frequency materialized view after ingestion.
+
+    The API reads root frequency from this view instead of aggregating the
+    morphology table per request, so it must be refreshed whenever the
+    morphology data changes. CONCURRENTLY (enabled by the unique index on
+    root) keeps the view readable during the refresh, but cannot run inside
+    a transaction block — hence the autocommit connection.
+    """
+    print("Refreshing mv_root_frequency materialized view...")
+    try:
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            conn.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY mv_root_frequency"))
+        print("  Refreshed.")
+    except Exception as exc:
+        print(f"  WARNING: could not refresh mv_root_frequency: {exc}")
+        print("  Run 'alembic upgrade head' and refresh the view manually.")
+
 
 def _insert_batch(conn: sa.Connection, batch: list[dict], skip_duplicates: bool) -> None:
     """Insert a batch of morphology records."""
@@ -530,6 +567,7 @@ def _insert_batch(conn: sa.Connection, batch: list[dict], skip_duplicates: bool)
                          verse_id, word_uthmani, word_imlaei,
                          segment_uthmani, segment_imlaei,
                          morpheme_type, pos_tag, root, lemma, pattern,
+                         root_normalized, lemma_normalized,
                          person, gender, number, case_state, mood_voice,
                          syntactic_role, irab_description)
                     SELECT
@@ -537,6 +575,7 @@ def _insert_batch(conn: sa.Connection, batch: list[dict], skip_duplicates: bool)
                         :verse_id, :word_uthmani, :word_imlaei,
                         :segment_uthmani, :segment_imlaei,
                         :morpheme_type, :pos_tag, :root, :lemma, :pattern,
+                        :root_normalized, :lemma_normalized,
                         :person, :gender, :number, :case_state, :mood_voice,
                         :syntactic_role, :irab_description
                     WHERE NOT EXISTS (
@@ -558,6 +597,7 @@ def _insert_batch(conn: sa.Connection, batch: list[dict], skip_duplicates: bool)
                          verse_id, word_uthmani, word_imlaei,
                          segment_uthmani, segment_imlaei,
                          morpheme_type, pos_tag, root, lemma, pattern,
+                         root_normalized, lemma_normalized,
                          person, gender, number, case_state, mood_voice,
                          syntactic_role, irab_description)
                     VALUES
@@ -565,6 +605,7 @@ def _insert_batch(conn: sa.Connection, batch: list[dict], skip_duplicates: bool)
                          :verse_id, :word_uthmani, :word_imlaei,
                          :segment_uthmani, :segment_imlaei,
                          :morpheme_type, :pos_tag, :root, :lemma, :pattern,
+                         :root_normalized, :lemma_normalized,
                          :person, :gender, :number, :case_state, :mood_voice,
                          :syntactic_role, :irab_description)
                 """),
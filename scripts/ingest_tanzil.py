@@ -335,6 +335,35 @@ def calc_abjad(text: str, system: dict[str, int]) -> int:
     return sum(system.get(ch, 0) for ch in stripped)
 
 
+def verse_stats(text: str) -> tuple[str, str, int, int, int, int]:
+    """
+    One-pass per-verse statistics for the load phase.
+
+    Returns (text_no_tashkeel, text_normalized, letter_count, word_count,
+    abjad_mashriqi, abjad_maghribi). The naive pipeline strips tashkeel
+    four times per verse (normalize_text, the text_no_tashkeel column, and
+    once inside calc_abjad per Abjad system); this fuses the strip and both
+    Abjad accumulations into a single scan over the raw text.
+    """
+    stripped_chars: list[str] = []
+    abjad_m = 0
+    abjad_g = 0
+    mashriqi_get = ABJAD_MASHRIQI.get
+    maghribi_get = ABJAD_MAGHRIBI.get
+    for ch in text:
+        if ch in TASHKEEL:
+            continue
+        stripped_chars.append(ch)
+        abjad_m += mashriqi_get(ch, 0)
+        abjad_g += maghribi_get(ch, 0)
+
+    text_no_tash = "".join(stripped_chars)
+    text_norm = text_no_tash.translate(ALIF_NORMALIZE)
+    letters = count_letters(text_norm)
+    words = count_words(text_no_tash)
+    return text_no_tash, text_norm, letters, words, abjad_m, abjad_g
+
+
 def sha256_checksum(text: str) -> str:
     return hashlib.sha256(text.encode("utf-8")).hexdigest()
 
@@ -524,13 +553,8 @@ def ingest(
                     continue
 
                 text_simple = (simple_data or {}).get(s_num, {}).get(v_num)
-                text_norm = normalize_text(text_uthmani)
-                text_no_tash = strip_tashkeel(text_uthmani)
-
-                letters = count_letters(text_norm)
-                words = count_words(text_no_tash)
-                abjad_m = calc_abjad(text_uthmani, ABJAD_MASHRIQI)
-                abjad_g = calc_abjad(text_uthmani, ABJAD_MAGHRIBI)
+                (text_no_tash, text_norm,
+                 letters, words, abjad_m, abjad_g) = verse_stats(text_uthmani)
 
                 batch_letters += letters
                 batch_words += words
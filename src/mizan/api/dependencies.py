@@ -15,7 +15,10 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from mizan.application.services.analyzer_service import AnalyzerService
 from mizan.infrastructure.cache.redis_cache import RedisCache, get_cache
 from mizan.infrastructure.config import get_settings
-from mizan.infrastructure.persistence.database import get_async_session
+from mizan.infrastructure.persistence.database import (
+    get_async_session,
+    get_readonly_session,
+)
 from mizan.infrastructure.persistence.repositories import (
     PostgresMorphologyRepository,
     PostgresQuranRepository,
@@ -29,22 +32,32 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
         yield session
 
 
+async def get_readonly_db_session() -> AsyncGenerator[AsyncSession, None]:
+    """Get read-only database session dependency.
+
+    Used by the pure-read repositories (verses, analysis, morphology) so
+    those endpoints skip the per-request COMMIT round-trip.
+    """
+    async for session in get_readonly_session():
+        yield session
+
+
 async def get_quran_repository(
-    session: Annotated[AsyncSession, Depends(get_db_session)],
+    session: Annotated[AsyncSession, Depends(get_readonly_db_session)],
 ) -> PostgresQuranRepository:
     """Get Quran repository dependency."""
     return PostgresQuranRepository(session)
 
 
 async def get_surah_repository(
-    session: Annotated[AsyncSession, Depends(get_db_session)],
+    session: Annotated[AsyncSession, Depends(get_readonly_db_session)],
 ) -> PostgresSurahMetadataRepository:
     """Get Surah metadata repository dependency."""
     return PostgresSurahMetadataRepository(session)
 
 
 async def get_morphology_repository(
-    session: Annotated[AsyncSession, Depends(get_db_session)],
+    session: Annotated[AsyncSession, Depends(get_readonly_db_session)],
 ) -> PostgresMorphologyRepository:
     """Get Morphology repository dependency."""
     return PostgresMorphologyRepository(session)
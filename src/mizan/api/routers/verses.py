@@ -135,7 +135,7 @@ async def get_juz_verses(
 
     Returns verses grouped by the specified Juz.
     """
-    verses = await quran_repo.get_verses_by_criteria(juz_number=juz_number)
+    verses = await quran_repo.get_verse_previews_by_criteria(juz_number=juz_number)
 
     return {
         "juz_number": juz_number,
@@ -160,7 +160,7 @@ async def get_sajdah_verses(
 
     Returns the 15 Sajdah verses in the Quran.
     """
-    verses = await quran_repo.get_verses_by_criteria(has_sajdah=True)
+    verses = await quran_repo.get_verse_previews_by_criteria(has_sajdah=True)
 
     return {
         "total": len(verses),
@@ -170,7 +170,7 @@ async def get_sajdah_verses(
                 "verse": v.verse_number,
                 "text": v.text_uthmani,
                 "sajdah_type": v.sajdah_type.value if v.sajdah_type else None,
-                "surah_name": v.surah_metadata.name_arabic,
+                "surah_name": v.surah_name_arabic,
             }
             for v in verses
         ],
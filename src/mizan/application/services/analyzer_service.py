@@ -356,7 +356,9 @@ class AnalyzerService:
         normalized_query = self._normalizer.normalize(query, normalization)
 
         # Search using repository
-        verses = await self._repo.search_text(
+        # Result rows only render location + text, so fetch the pruned
+        # preview projection instead of full verse aggregates.
+        verses = await self._repo.search_text_previews(
             normalized_query,
             surah_number=surah_number,
             case_sensitive=False,
@@ -369,7 +371,7 @@ class AnalyzerService:
                     "surah_number": verse.surah_number,
                     "verse_number": verse.verse_number,
                     "text": verse.text_uthmani,
-                    "surah_name": verse.surah_metadata.name_arabic,
+                    "surah_name": verse.surah_name_arabic,
                 }
             )
 
@@ -9,10 +9,12 @@ from mizan.domain.entities.library import (
 )
 from mizan.domain.entities.surah import Surah
 from mizan.domain.entities.verse import Verse
+from mizan.domain.entities.verse_preview import VersePreview
 
 __all__ = [
     "Surah",
     "Verse",
+    "VersePreview",
     "LibrarySpace",
     "SemanticSearchResult",
     "TextChunk",
@@ -0,0 +1,50 @@
+"""
+VersePreview - Lightweight read model for verse listings.
+
+List endpoints (Juz contents, sajdah verses, text search) only render a
+verse's location, its Uthmani text and a couple of flags — but the full
+Verse aggregate drags every script variant, qiraat JSONB, checksum and
+counter column out of the database for each row. This projection carries
+just the columns those listings actually use, so the repository can
+fetch rows 5-10x narrower and skip the full-entity construction.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from mizan.domain.enums import SajdahType
+
+if TYPE_CHECKING:
+    from mizan.domain.value_objects import VerseLocation
+
+
+@dataclass(frozen=True, slots=True)
+class VersePreview:
+    """
+    Narrow projection of a verse for list/search results.
+
+    Attributes:
+        location: Position in the Mushaf (surah:verse)
+        text_uthmani: Verse text in Uthmani script
+        is_sajdah: Whether this verse has a prostration mark
+        sajdah_type: Type of prostration (Wajib or Mustahabb)
+        surah_name_arabic: Arabic name of the parent surah
+    """
+
+    location: VerseLocation
+    text_uthmani: str
+    is_sajdah: bool
+    sajdah_type: SajdahType | None
+    surah_name_arabic: str
+
+    @property
+    def surah_number(self) -> int:
+        """Surah number from location."""
+        return self.location.surah_number
+
+    @property
+    def verse_number(self) -> int:
+        """Verse number from location."""
+        return self.location.verse_number
@@ -135,3 +135,20 @@ class AnalysisType(StrEnum):
 
     CONCEPT_MAP = "concept_map"
     """Generate concept relationship maps."""
+
+    @classmethod
+    def from_str(cls, value: str) -> "AnalysisType":
+        """
+        O(1) deserialization lookup over a dict frozen at import.
+
+        Bypasses ``Enum.__call__``'s generic coercion and iteration; use on
+        hot deserialization paths where the value is already a plain string.
+        Raises ``ValueError`` for unknown values, like the enum constructor.
+        """
+        try:
+            return _FAST_LOOKUP[value]
+        except KeyError:
+            raise ValueError(f"'{value}' is not a valid AnalysisType") from None
+
+
+_FAST_LOOKUP: dict[str, AnalysisType] = {member.value: member for member in AnalysisType}
@@ -34,3 +34,20 @@ class BasmalahStatus(StrEnum):
     Basmalah appears within verse text (not as opening).
     An-Naml 27:30 contains the Basmalah within the verse.
     """
+
+    @classmethod
+    def from_str(cls, value: str) -> "BasmalahStatus":
+        """
+        O(1) deserialization lookup over a dict frozen at import.
+
+        Bypasses ``Enum.__call__``'s generic coercion and iteration; use on
+        hot deserialization paths where the value is already a plain string.
+        Raises ``ValueError`` for unknown values, like the enum constructor.
+        """
+        try:
+            return _FAST_LOOKUP[value]
+        except KeyError:
+            raise ValueError(f"'{value}' is not a valid BasmalahStatus") from None
+
+
+_FAST_LOOKUP: dict[str, BasmalahStatus] = {member.value: member for member in BasmalahStatus}
@@ -52,3 +52,20 @@ class QiraatType(StrEnum):
 
     KHALAF = "khalaf"
     """خلف العاشر - The tenth canonical qira'at."""
+
+    @classmethod
+    def from_str(cls, value: str) -> "QiraatType":
+        """
+        O(1) deserialization lookup over a dict frozen at import.
+
+        Bypasses ``Enum.__call__``'s generic coercion and iteration; use on
+        hot deserialization paths where the value is already a plain string.
+        Raises ``ValueError`` for unknown values, like the enum constructor.
+        """
+        try:
+            return _FAST_LOOKUP[value]
+        except KeyError:
+            raise ValueError(f"'{value}' is not a valid QiraatType") from None
+
+
+_FAST_LOOKUP: dict[str, QiraatType] = {member.value: member for member in QiraatType}
@@ -23,3 +23,20 @@ class RevelationType(StrEnum):
     Generally longer surahs with themes of legislation,
     social organization, and community building.
     """
+
+    @classmethod
+    def from_str(cls, value: str) -> "RevelationType":
+        """
+        O(1) deserialization lookup over a dict frozen at import.
+
+        Bypasses ``Enum.__call__``'s generic coercion and iteration; use on
+        hot deserialization paths where the value is already a plain string.
+        Raises ``ValueError`` for unknown values, like the enum constructor.
+        """
+        try:
+            return _FAST_LOOKUP[value]
+        except KeyError:
+            raise ValueError(f"'{value}' is not a valid RevelationType") from None
+
+
+_FAST_LOOKUP: dict[str, RevelationType] = {member.value: member for member in RevelationType}
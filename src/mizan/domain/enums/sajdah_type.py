@@ -23,3 +23,20 @@ class SajdahType(StrEnum):
     Prostration is encouraged but not obligatory.
     11 verses: 7:206, 13:15, 16:50, 17:109, 19:58, 22:18, 22:77, 25:60, 27:26, 38:24, 84:21
     """
+
+    @classmethod
+    def from_str(cls, value: str) -> "SajdahType":
+        """
+        O(1) deserialization lookup over a dict frozen at import.
+
+        Bypasses ``Enum.__call__``'s generic coercion and iteration; use on
+        hot deserialization paths where the value is already a plain string.
+        Raises ``ValueError`` for unknown values, like the enum constructor.
+        """
+        try:
+            return _FAST_LOOKUP[value]
+        except KeyError:
+            raise ValueError(f"'{value}' is not a valid SajdahType") from None
+
+
+_FAST_LOOKUP: dict[str, SajdahType] = {member.value: member for member in SajdahType}
@@ -42,3 +42,20 @@ class ScriptType(StrEnum):
     - Standard diacritical placement
     - Easier for modern readers
     """
+
+    @classmethod
+    def from_str(cls, value: str) -> "ScriptType":
+        """
+        O(1) deserialization lookup over a dict frozen at import.
+
+        Bypasses ``Enum.__call__``'s generic coercion and iteration; use on
+        hot deserialization paths where the value is already a plain string.
+        Raises ``ValueError`` for unknown values, like the enum constructor.
+        """
+        try:
+            return _FAST_LOOKUP[value]
+        except KeyError:
+            raise ValueError(f"'{value}' is not a valid ScriptType") from None
+
+
+_FAST_LOOKUP: dict[str, ScriptType] = {member.value: member for member in ScriptType}
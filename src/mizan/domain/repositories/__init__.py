@@ -5,7 +5,9 @@ from mizan.domain.repositories.interfaces import (
     IntegrityReport,
     IQuranRepository,
     ISurahMetadataRepository,
+    MorphologyColumns,
     MorphologyData,
+    SlimIntegrityReport,
 )
 from mizan.domain.repositories.library_interfaces import (
     ILibrarySpaceRepository,
@@ -19,7 +21,9 @@ __all__ = [
     "IMorphologyRepository",
     "IQuranRepository",
     "ISurahMetadataRepository",
+    "MorphologyColumns",
     "MorphologyData",
+    "SlimIntegrityReport",
     "ILibrarySpaceRepository",
     "ITextChunkRepository",
     "ITextSourceRepository",
@@ -7,19 +7,28 @@ Implementations are provided by the infrastructure layer (adapters).
 
 from __future__ import annotations
 
+import hmac
+import sys
 from abc import ABC, abstractmethod
-from collections.abc import AsyncIterator
-from dataclasses import dataclass
-from datetime import datetime
+from array import array
+from collections.abc import AsyncIterator, Mapping, Sequence
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
 from typing import TYPE_CHECKING
 
+from mizan.domain.value_objects import VerseLocation
+from mizan.domain.value_objects.verse_location import TOTAL_QURAN_VERSES
+
 if TYPE_CHECKING:
-    from mizan.domain.entities import Surah, Verse
+    from mizan.domain.entities import Surah, Verse, VersePreview
     from mizan.domain.enums import RevelationType
-    from mizan.domain.value_objects import SurahMetadata, VerseLocation
+    from mizan.domain.value_objects import SurahMetadata
+
+# Size of a failure bitmap over the 6,236-verse global ayah indexing.
+_BITMAP_BYTES = (TOTAL_QURAN_VERSES + 7) // 8
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class IntegrityReport:
     """
     Result of integrity verification.
@@ -31,30 +40,160 @@ class IntegrityReport:
         checked_at: When verification was performed
         total_verses: Total number of verses checked
         failed_verses: Locations of verses that failed verification
-        expected_checksum: Expected overall checksum
-        actual_checksum: Actual computed checksum
+        expected_checksum: Expected overall checksum (raw SHA-256 digest)
+        actual_checksum: Actual computed checksum (raw SHA-256 digest)
         details: Human-readable summary
+        chunk_index: Position in a streaming verification run (None outside one)
+        is_terminal: False for interim streaming reports, True for the final one
     """
 
     is_valid: bool
     checked_at: datetime
     total_verses: int
     failed_verses: tuple[VerseLocation, ...]
-    expected_checksum: str
-    actual_checksum: str
+    expected_checksum: bytes
+    actual_checksum: bytes
     details: str
+    chunk_index: int | None = None
+    is_terminal: bool = True
+
+    # Derived once in __post_init__; the report is frozen, so recomputing
+    # them on every property access (logging, dashboards) is wasted work.
+    _failure_count: int = field(init=False, repr=False, compare=False)
+    _success_rate: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Precompute derived statistics for repeated access."""
+        failure_count = len(self.failed_verses)
+        if self.total_verses == 0:
+            success_rate = 0.0
+        else:
+            success_rate = ((self.total_verses - failure_count) / self.total_verses) * 100
+        object.__setattr__(self, "_failure_count", failure_count)
+        object.__setattr__(self, "_success_rate", success_rate)
+
+    @property
+    def expected_hex(self) -> str:
+        """Expected checksum as a hex string (for display/logging)."""
+        return self.expected_checksum.hex()
+
+    @property
+    def actual_hex(self) -> str:
+        """Actual checksum as a hex string (for display/logging)."""
+        return self.actual_checksum.hex()
+
+    def failed_bitmap(self) -> bytes:
+        """
+        Failures as a little-endian bitmap over the global ayah index.
+
+        780 bytes regardless of failure count — versus ~100+ bytes per
+        VerseLocation — so chunked reports from stream_verify_integrity can
+        be persisted and merged cheaply.
+        """
+        bits = 0
+        for location in self.failed_verses:
+            bits |= 1 << location.global_index
+        return bits.to_bytes(_BITMAP_BYTES, "little")
+
+    @staticmethod
+    def merge_bitmaps(*bitmaps: bytes) -> bytes:
+        """OR together failure bitmaps (e.g. from per-chunk reports)."""
+        merged = 0
+        for bitmap in bitmaps:
+            merged |= int.from_bytes(bitmap, "little")
+        return merged.to_bytes(_BITMAP_BYTES, "little")
+
+    @staticmethod
+    def failures_from_bitmap(bitmap: bytes) -> tuple[VerseLocation, ...]:
+        """Expand a failure bitmap back into sorted VerseLocations."""
+        value = int.from_bytes(bitmap, "little")
+        failures: list[VerseLocation] = []
+        while value:
+            low_bit = value & -value
+            failures.append(VerseLocation.from_global_index(low_bit.bit_length() - 1))
+            value ^= low_bit
+        return tuple(failures)
+
+    def checksums_match(self) -> bool:
+        """
+        Compare the overall digests in constant time.
+
+        Raw 32-byte digests compare in half the memory of hex strings, and
+        hmac.compare_digest keeps the comparison timing-independent.
+        """
+        return hmac.compare_digest(self.expected_checksum, self.actual_checksum)
 
     @property
     def failure_count(self) -> int:
         """Get number of failed verifications."""
-        return len(self.failed_verses)
+        return self._failure_count
 
     @property
     def success_rate(self) -> float:
         """Get verification success rate as percentage."""
-        if self.total_verses == 0:
-            return 0.0
-        return ((self.total_verses - self.failure_count) / self.total_verses) * 100
+        return self._success_rate
+
+
+@dataclass(frozen=True, slots=True)
+class SlimIntegrityReport:
+    """
+    Lightweight per-chunk checkpoint from streaming verification.
+
+    Interim reports are emitted every chunk during
+    stream_verify_integrity; carrying a datetime, details string and
+    checksum pair on each would dominate the cost of cheap checkpoints.
+    This form is just a flag, a failure bitmap and two ints — call
+    :meth:`promote` once on the terminal report when the full
+    IntegrityReport is needed.
+
+    Attributes:
+        is_valid: No failures so far
+        failed_bitmap: Little-endian failure bitmap over the global ayah index
+        total_verses: Verses checked so far
+        chunk_index: Position in the streaming run
+        is_terminal: False for interim checkpoints, True for the final one
+        actual_checksum: Full-corpus SHA-256 digest (terminal report only)
+    """
+
+    is_valid: bool
+    failed_bitmap: bytes
+    total_verses: int
+    chunk_index: int
+    is_terminal: bool = False
+    actual_checksum: bytes = b""
+
+    @staticmethod
+    def pack_bitmap(bits: int) -> bytes:
+        """Serialize an accumulated failure-bit int into bitmap bytes."""
+        return bits.to_bytes(_BITMAP_BYTES, "little")
+
+    @property
+    def failure_count(self) -> int:
+        """Get number of failed verifications (bitmap popcount)."""
+        return int.from_bytes(self.failed_bitmap, "little").bit_count()
+
+    def promote(self, expected_checksum: bytes = b"") -> IntegrityReport:
+        """
+        Expand into a full IntegrityReport (terminal attestation).
+
+        Args:
+            expected_checksum: Reference digest to record, if known
+
+        Returns:
+            IntegrityReport with the bitmap expanded to VerseLocations
+        """
+        failed_verses = IntegrityReport.failures_from_bitmap(self.failed_bitmap)
+        return IntegrityReport(
+            is_valid=self.is_valid,
+            checked_at=datetime.now(UTC),
+            total_verses=self.total_verses,
+            failed_verses=failed_verses,
+            expected_checksum=expected_checksum,
+            actual_checksum=self.actual_checksum,
+            details=f"Verified {self.total_verses} verses, {len(failed_verses)} failures",
+            chunk_index=self.chunk_index,
+            is_terminal=self.is_terminal,
+        )
 
 
 class IQuranRepository(ABC):
@@ -110,6 +249,26 @@ class IQuranRepository(ABC):
         """
         ...
 
+    @abstractmethod
+    async def get_verses(
+        self,
+        locations: Sequence[VerseLocation],
+    ) -> dict[VerseLocation, Verse]:
+        """
+        Retrieve an arbitrary set of verses in one round-trip.
+
+        Batch counterpart of get_verse for callers that need scattered
+        locations (sajdah sweeps, cross-references): implementations issue
+        a single query instead of one per verse.
+
+        Args:
+            locations: Verse locations to fetch (duplicates are collapsed)
+
+        Returns:
+            Mapping of location to Verse; missing locations are omitted
+        """
+        ...
+
     @abstractmethod
     async def get_verses_in_range(
         self,
@@ -149,6 +308,11 @@ class IQuranRepository(ABC):
         """
         Stream verses for memory-efficient processing.
 
+        Deliberately NOT ``async def``: the method returns the async
+        iterator directly (implementations are async generators), so
+        consumers write ``async for verse in repo.stream_verses()`` with no
+        extra ``await`` and no intermediate coroutine per call.
+
         Args:
             surah_number: Optional filter by surah (None = all verses)
 
@@ -194,6 +358,34 @@ class IQuranRepository(ABC):
         """
         ...
 
+    @abstractmethod
+    async def get_verse_previews_by_criteria(
+        self,
+        revelation_type: RevelationType | None = None,
+        juz_number: int | None = None,
+        hizb_number: int | None = None,
+        manzil_number: int | None = None,
+        has_sajdah: bool | None = None,
+    ) -> list[VersePreview]:
+        """
+        Query verse previews by various criteria.
+
+        Column-pruned counterpart of get_verses_by_criteria for listings
+        that only render location + text: implementations fetch just the
+        preview columns instead of the full verse row.
+
+        Args:
+            revelation_type: Filter by Meccan/Medinan
+            juz_number: Filter by Juz (1-30)
+            hizb_number: Filter by Hizb (1-60)
+            manzil_number: Filter by Manzil (1-7)
+            has_sajdah: Filter for sajdah verses
+
+        Returns:
+            List of matching verse previews
+        """
+        ...
+
     @abstractmethod
     async def search_text(
         self,
@@ -214,6 +406,29 @@ class IQuranRepository(ABC):
         """
         ...
 
+    @abstractmethod
+    async def search_text_previews(
+        self,
+        query: str,
+        surah_number: int | None = None,
+        case_sensitive: bool = False,
+    ) -> list[VersePreview]:
+        """
+        Search for text within verses, returning previews.
+
+        Column-pruned counterpart of search_text for result listings that
+        only render location + text.
+
+        Args:
+            query: Text to search for
+            surah_number: Optional filter by surah
+            case_sensitive: Whether search is case-sensitive
+
+        Returns:
+            List of verse previews containing the query
+        """
+        ...
+
     @abstractmethod
     async def verify_integrity(self) -> IntegrityReport:
         """
@@ -224,6 +439,29 @@ class IQuranRepository(ABC):
         """
         ...
 
+    @abstractmethod
+    def stream_verify_integrity(
+        self,
+        chunk_size: int = 1024,
+    ) -> AsyncIterator[SlimIntegrityReport]:
+        """
+        Verify integrity incrementally, overlapping I/O and hashing.
+
+        Implementations update one running SHA-256 digest as verses stream
+        from storage and emit a cheap SlimIntegrityReport checkpoint every
+        ``chunk_size`` verses (``is_terminal=False``, overall checksum not
+        yet final), followed by one terminal checkpoint carrying the
+        full-corpus digest — promote() that one if a full IntegrityReport
+        attestation is needed.
+
+        Args:
+            chunk_size: Number of verses per interim checkpoint
+
+        Yields:
+            Interim SlimIntegrityReports, then a terminal one
+        """
+        ...
+
 
 class ISurahMetadataRepository(ABC):
     """
@@ -269,7 +507,7 @@ class ISurahMetadataRepository(ABC):
         ...
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MorphologyData:
     """
     Morphological analysis data for a word.
@@ -308,6 +546,61 @@ class MorphologyData:
     syntactic_role: str | None
     irab_description: str | None
 
+    def __post_init__(self) -> None:
+        """Intern the small-cardinality category fields.
+
+        ~128k instances carry values like STEM/PREFIX/SUFFIX or M/F;
+        interning collapses them to shared objects, so equality and set
+        membership in downstream scans hit the pointer-identity fast path.
+        """
+        for name in ("morpheme_type", "person", "gender", "number"):
+            value = getattr(self, name)
+            if value is not None:
+                object.__setattr__(self, name, sys.intern(value))
+
+
+@dataclass(frozen=True, slots=True)
+class MorphologyColumns:
+    """
+    Columnar (structure-of-arrays) view of the morphology corpus.
+
+    Corpus-wide scans over list[list[MorphologyData]] dereference 14
+    attributes on ~128k heap objects. Here each field is one flat tuple of
+    small integer category codes aligned by row, with per-field label
+    tables for decoding — frequency counting and filtering walk packed
+    int tuples instead of objects. Code 0 always decodes to None for the
+    nullable fields.
+
+    Attributes:
+        surah_numbers: Surah number per row
+        verse_numbers: Verse number per row
+        word_numbers: Word number per row
+        roots: Root code per row (see root_labels)
+        lemmas: Lemma code per row (see lemma_labels)
+        pos_tags: Part-of-speech code per row (see pos_labels)
+        morpheme_types: Morpheme-type code per row (see morpheme_type_labels)
+        root_labels: Code -> root string (index 0 is None)
+        lemma_labels: Code -> lemma string (index 0 is None)
+        pos_labels: Code -> POS tag string
+        morpheme_type_labels: Code -> morpheme type string
+    """
+
+    surah_numbers: tuple[int, ...]
+    verse_numbers: tuple[int, ...]
+    word_numbers: tuple[int, ...]
+    roots: tuple[int, ...]
+    lemmas: tuple[int, ...]
+    pos_tags: tuple[int, ...]
+    morpheme_types: tuple[int, ...]
+    root_labels: tuple[str | None, ...]
+    lemma_labels: tuple[str | None, ...]
+    pos_labels: tuple[str, ...]
+    morpheme_type_labels: tuple[str, ...]
+
+    def __len__(self) -> int:
+        """Number of morpheme rows."""
+        return len(self.roots)
+
 
 class IMorphologyRepository(ABC):
     """
@@ -352,6 +645,27 @@ class IMorphologyRepository(ABC):
         """
         ...
 
+    @abstractmethod
+    async def get_morphology_batch(
+        self,
+        locations: Sequence[tuple[VerseLocation, int]],
+    ) -> dict[tuple[VerseLocation, int], list[MorphologyData]]:
+        """
+        Get morphology for many (location, word_number) pairs in one query.
+
+        Root/lemma sweeps iterate tens of thousands of word references;
+        fetching them one get_word_morphology call at a time is O(N)
+        round-trips.
+
+        Args:
+            locations: (verse location, word number) pairs
+
+        Returns:
+            Mapping of each requested pair to its morphemes (missing pairs
+            map to an empty list)
+        """
+        ...
+
     @abstractmethod
     async def search_by_root(self, root: str) -> list[tuple[VerseLocation, int]]:
         """
@@ -365,6 +679,45 @@ class IMorphologyRepository(ABC):
         """
         ...
 
+    @abstractmethod
+    async def search_by_root_packed(self, root: str) -> array[int]:
+        """
+        Find all occurrences of a root as packed uint32 identifiers.
+
+        Each element is ``VerseLocation.pack_word(word_number)`` — a plain
+        int instead of a (value object, int) tuple, so corpus-scale
+        sort/set/intersect pipelines skip per-match object allocation.
+        Unpack with :meth:`VerseLocation.unpack_word` when the rich form
+        is needed.
+
+        Args:
+            root: Arabic root (e.g., ك-ت-ب or كتب)
+
+        Returns:
+            Sorted array of packed (surah, verse, word) identifiers
+        """
+        ...
+
+    @abstractmethod
+    async def search_by_roots(
+        self,
+        roots: Sequence[str],
+    ) -> dict[str, list[tuple[VerseLocation, int]]]:
+        """
+        Find occurrences of many roots in one query.
+
+        Comparative root studies issue one search_by_root call per root;
+        batching them into a single scan avoids N round-trips.
+
+        Args:
+            roots: Arabic roots (e.g., ك-ت-ب or كتب)
+
+        Returns:
+            Mapping of each requested root to its (location, word_number)
+            tuples (roots with no occurrences map to an empty list)
+        """
+        ...
+
     @abstractmethod
     async def search_by_lemma(self, lemma: str) -> list[tuple[VerseLocation, int]]:
         """
@@ -379,21 +732,41 @@ class IMorphologyRepository(ABC):
         ...
 
     @abstractmethod
-    async def get_root_frequency(self) -> dict[str, int]:
+    async def load_columns(self) -> MorphologyColumns:
+        """
+        Load the whole corpus as a columnar (SoA) snapshot.
+
+        Intended for corpus-wide analytical scans (root/lemma frequency,
+        co-occurrence) where walking per-morpheme objects is the
+        bottleneck.
+
+        Returns:
+            MorphologyColumns with one code tuple per field
+        """
+        ...
+
+    @abstractmethod
+    async def get_root_frequency(self) -> Mapping[str, int]:
         """
         Get frequency distribution of all roots.
 
+        Results may be cached and shared between callers — treat the
+        returned mapping as immutable.
+
         Returns:
-            Dictionary mapping roots to occurrence counts
+            Mapping of roots to occurrence counts
         """
         ...
 
     @abstractmethod
-    async def get_unique_roots(self) -> set[str]:
+    async def get_unique_roots(self) -> frozenset[str]:
         """
         Get all unique roots in the Quran.
 
+        Results may be cached and shared between callers — treat the
+        returned set as immutable.
+
         Returns:
-            Set of all roots
+            Frozen set of all roots
         """
         ...
@@ -6,11 +6,18 @@ Computes Abjad/Gematria numerical values for Arabic text.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Final
+import random
+from collections.abc import Mapping
+from functools import lru_cache
+from math import gcd
+from types import MappingProxyType
+from typing import Final
 
-if TYPE_CHECKING:
-    from mizan.domain.enums import AbjadSystem
-    from mizan.domain.value_objects import AbjadValue
+# Runtime import (not just TYPE_CHECKING): the merged lookup tables below are
+# keyed by AbjadSystem and built once at module load. enums has no dependency
+# on services, so this is cycle-free.
+from mizan.domain.enums import AbjadSystem
+from mizan.domain.value_objects import AbjadValue
 
 
 class AbjadCalculator:
@@ -21,91 +28,63 @@ class AbjadCalculator:
     Two main systems exist: Mashriqi (Eastern) and Maghribi (Western).
     """
 
-    # Mashriqi (Eastern) Abjad values - أبجد هوز حطي كلمن سعفص قرشت ثخذ ضظغ
-    MASHRIQI_VALUES: Final[dict[str, int]] = {
+    # Single canonical table: letter -> (Mashriqi, Maghribi) value pair.
+    # The two systems agree on every letter except س ش ص ض, so keeping one
+    # merged table removes the duplicated rows the two separate dicts
+    # carried and makes divergence between them impossible. The per-system
+    # views below are derived from it.
+    ABJAD_VALUES: Final[Mapping[str, tuple[int, int]]] = MappingProxyType({
         # Units (1-9)
-        "ا": 1,
-        "أ": 1,
-        "إ": 1,
-        "آ": 1,
-        "ء": 1,
-        "\u0671": 1,  # Alif variants + Alif Wasla
-        "ب": 2,
-        "ج": 3,
-        "د": 4,
-        "ه": 5,
-        "و": 6,
-        "ز": 7,
-        "ح": 8,
-        "ط": 9,
+        "ا": (1, 1),
+        "أ": (1, 1),
+        "إ": (1, 1),
+        "آ": (1, 1),
+        "ء": (1, 1),
+        "\u0671": (1, 1),  # Alif variants + Alif Wasla
+        "ب": (2, 2),
+        "ج": (3, 3),
+        "د": (4, 4),
+        "ه": (5, 5),
+        "و": (6, 6),
+        "ز": (7, 7),
+        "ح": (8, 8),
+        "ط": (9, 9),
         # Tens (10-90)
-        "ي": 10,
-        "ى": 10,
-        "ئ": 10,  # Ya variants
-        "ك": 20,
-        "ل": 30,
-        "م": 40,
-        "ن": 50,
-        "س": 60,
-        "ع": 70,
-        "ف": 80,
-        "ص": 90,
+        "ي": (10, 10),
+        "ى": (10, 10),
+        "ئ": (10, 10),  # Ya variants
+        "ك": (20, 20),
+        "ل": (30, 30),
+        "م": (40, 40),
+        "ن": (50, 50),
+        "س": (60, 300),  # Mashriqi vs Maghribi ordering diverges here
+        "ع": (70, 70),
+        "ف": (80, 80),
+        "ص": (90, 60),
         # Hundreds (100-900)
-        "ق": 100,
-        "ر": 200,
-        "ش": 300,
-        "ت": 400,
-        "ث": 500,
-        "خ": 600,
-        "ذ": 700,
-        "ض": 800,
-        "ظ": 900,
+        "ق": (100, 100),
+        "ر": (200, 200),
+        "ش": (300, 800),
+        "ت": (400, 400),
+        "ث": (500, 500),
+        "خ": (600, 600),
+        "ذ": (700, 700),
+        "ض": (800, 90),
+        "ظ": (900, 900),
         # Thousands
-        "غ": 1000,
-    }
+        "غ": (1000, 1000),
+    })
+
+    # Mashriqi (Eastern) Abjad values - أبجد هوز حطي كلمن سعفص قرشت ثخذ ضظغ
+    # (read-only derived view: ABJAD_VALUES is the single source of truth)
+    MASHRIQI_VALUES: Final[Mapping[str, int]] = MappingProxyType(
+        {letter: pair[0] for letter, pair in ABJAD_VALUES.items()}
+    )
 
     # Maghribi (Western) Abjad values - different ordering for س ش ص ض
-    MAGHRIBI_VALUES: Final[dict[str, int]] = {
-        # Units (1-9) - same as Mashriqi
-        "ا": 1,
-        "أ": 1,
-        "إ": 1,
-        "آ": 1,
-        "ء": 1,
-        "\u0671": 1,
-        "ب": 2,
-        "ج": 3,
-        "د": 4,
-        "ه": 5,
-        "و": 6,
-        "ز": 7,
-        "ح": 8,
-        "ط": 9,
-        # Tens (10-90) - same as Mashriqi
-        "ي": 10,
-        "ى": 10,
-        "ئ": 10,
-        "ك": 20,
-        "ل": 30,
-        "م": 40,
-        "ن": 50,
-        "ص": 60,  # Different from Mashriqi (س=60)
-        "ع": 70,
-        "ف": 80,
-        "ض": 90,  # Different from Mashriqi (ص=90)
-        # Hundreds (100-900)
-        "ق": 100,
-        "ر": 200,
-        "س": 300,  # Different from Mashriqi (ش=300)
-        "ت": 400,
-        "ث": 500,
-        "خ": 600,
-        "ذ": 700,
-        "ش": 800,  # Different from Mashriqi (ض=800)
-        "ظ": 900,
-        # Thousands
-        "غ": 1000,
-    }
+    MAGHRIBI_VALUES: Final[Mapping[str, int]] = MappingProxyType(
+        {letter: pair[1] for letter, pair in ABJAD_VALUES.items()}
+    )
 
     # Alif Khanjariyya - superscript Alif (counts as Alif)
     ALIF_KHANJARIYYA: Final[str] = "\u0670"
@@ -127,27 +106,25 @@ class AbjadCalculator:
         Returns:
             AbjadValue with total and breakdown
         """
-        from mizan.domain.enums import AbjadSystem
-        from mizan.domain.value_objects import AbjadValue
-
         system = system or AbjadSystem.MASHRIQI
-        values = self.MASHRIQI_VALUES if system == AbjadSystem.MASHRIQI else self.MAGHRIBI_VALUES
 
+        # Single merged-table probe per character: the Alif Khanjariyya special
+        # case is folded into the table selected above, so the hot loop has no
+        # per-char branching beyond the miss check.
+        lookup = _LUT[system, include_alif_khanjariyya].get
         breakdown: list[tuple[str, int]] = []
+        append = breakdown.append
         total = 0
 
         for char in text:
-            # Check for Alif Khanjariyya
-            if char == self.ALIF_KHANJARIYYA and include_alif_khanjariyya:
-                val = 1  # Same as Alif
-                breakdown.append((char, val))
-                total += val
-            elif char in values:
-                val = values[char]
-                breakdown.append((char, val))
+            val = lookup(char)
+            if val is not None:
+                append((char, val))
                 total += val
 
-        return AbjadValue(
+        # The total was just accumulated from the breakdown, so skip the
+        # value object's redundant re-validation sum.
+        return AbjadValue._trusted(
             system=system,
             value=total,
             letter_breakdown=tuple(breakdown),
@@ -161,9 +138,11 @@ class AbjadCalculator:
         """
         Calculate Abjad value and return just the integer.
 
-        Convenience method when full breakdown is not needed.
+        Convenience method when full breakdown is not needed. Unlike
+        `calculate`, this path allocates no per-letter breakdown tuples:
+        the whole scan runs as a C-level map/filter/sum pipeline.
         """
-        return self.calculate(text, system).value
+        return _abjad_sum(text, system or AbjadSystem.MASHRIQI)
 
     def get_value(
         self,
@@ -180,27 +159,17 @@ class AbjadCalculator:
         Returns:
             Integer value or None if not a valued letter
         """
-        from mizan.domain.enums import AbjadSystem
-
         system = system or AbjadSystem.MASHRIQI
-        values = self.MASHRIQI_VALUES if system == AbjadSystem.MASHRIQI else self.MAGHRIBI_VALUES
-
-        if letter == self.ALIF_KHANJARIYYA:
-            return 1
-        return values.get(letter)
+        return _LUT[system, True].get(letter)
 
     def is_prime(self, value: int) -> bool:
-        """Check if an Abjad value is a prime number."""
-        if value < 2:
-            return False
-        if value == 2:
-            return True
-        if value % 2 == 0:
-            return False
-        for i in range(3, int(value**0.5) + 1, 2):
-            if value % i == 0:
-                return False
-        return True
+        """
+        Check if an Abjad value is a prime number.
+
+        Uses deterministic Miller-Rabin (exact for anything an Abjad total
+        can reach) instead of trial division up to sqrt(n).
+        """
+        return _is_prime(value)
 
     def factorize(self, value: int) -> list[int]:
         """
@@ -214,28 +183,169 @@ class AbjadCalculator:
         """
         if value < 2:
             return []
+        return _factorize(value)
 
-        factors = []
-        d = 2
-        while d * d <= value:
-            while value % d == 0:
-                factors.append(d)
-                value //= d
-            d += 1
-        if value > 1:
-            factors.append(value)
-        return factors
-
-    def digital_root(self, value: int) -> int:
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Clear the memoized Abjad totals (mainly for test isolation)."""
+        _abjad_sum.cache_clear()
+
+    @staticmethod
+    def digital_root(value: int) -> int:
         """
         Calculate digital root (repeated digit sum until single digit).
 
+        Static and branchless (`value and ...` short-circuits the zero
+        case), so tight numerological loops pay no method binding or jump.
+
         Args:
             value: The value to reduce
 
         Returns:
             Single digit (1-9) or 0 if value is 0
         """
-        if value == 0:
-            return 0
-        return 1 + (value - 1) % 9
+        return value and 1 + (value - 1) % 9
+
+
+# System -> canonical table, so selection is a single dict hit rather than
+# enum equality tests.
+_VALUES_BY_SYSTEM: Final[dict[AbjadSystem, Mapping[str, int]]] = {
+    AbjadSystem.MASHRIQI: AbjadCalculator.MASHRIQI_VALUES,
+    AbjadSystem.MAGHRIBI: AbjadCalculator.MAGHRIBI_VALUES,
+}
+
+# Merged per-(system, include_alif_khanjariyya) lookup tables, built once at
+# import. Folding the superscript-Alif rule into the table lets the hot loop
+# in `calculate` resolve every character with a single dict probe.
+_LUT: Final[dict[tuple[AbjadSystem, bool], dict[str, int]]] = {
+    (system, with_khanjariyya): (
+        {**values, AbjadCalculator.ALIF_KHANJARIYYA: 1} if with_khanjariyya else dict(values)
+    )
+    for system, values in _VALUES_BY_SYSTEM.items()
+    for with_khanjariyya in (True, False)
+}
+
+
+@lru_cache(maxsize=131072)
+def _abjad_sum(text: str, system: AbjadSystem) -> int:
+    """
+    Memoized Abjad total without breakdown allocation.
+
+    `map`/`filter`/`sum` all execute in C: one dict probe per character,
+    misses (None) filtered out, no per-letter tuples for the GC to chase.
+    The LRU turns re-scans of repeated tokens (divine names, stopwords,
+    repeated phrases) across corpus analyses into a single hash lookup.
+    """
+    return sum(filter(None, map(_LUT[system, True].get, text)))
+
+
+# Module-level alias: lets hot loops skip the class attribute lookup.
+digital_root = AbjadCalculator.digital_root
+
+
+# Witness bases making Miller-Rabin deterministic for n < 3.3e24 — far beyond
+# any whole-Quran Abjad total.
+_MILLER_RABIN_BASES: Final[tuple[int, ...]] = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+
+# Mod-30 wheel increments starting from d=7 (skips multiples of 2, 3, 5).
+_WHEEL_INCREMENTS: Final[tuple[int, ...]] = (4, 2, 4, 2, 4, 6, 2, 6)
+
+
+def _is_prime(n: int) -> bool:
+    """Deterministic Miller-Rabin primality test."""
+    if n < 2:
+        return False
+    for p in _MILLER_RABIN_BASES:
+        if n % p == 0:
+            return n == p
+
+    d = n - 1
+    r = 0
+    while d % 2 == 0:
+        d //= 2
+        r += 1
+
+    for a in _MILLER_RABIN_BASES:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(r - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def _factorize(n: int) -> list[int]:
+    """
+    Prime factorization: 2-3-5 strip, mod-30 wheel trial division for small
+    divisors, then Miller-Rabin + Brent's Pollard-Rho for any large residual.
+    """
+    factors: list[int] = []
+    for p in (2, 3, 5):
+        while n % p == 0:
+            factors.append(p)
+            n //= p
+
+    d = 7
+    i = 0
+    while d * d <= n and d < 1 << 16:
+        while n % d == 0:
+            factors.append(d)
+            n //= d
+        d += _WHEEL_INCREMENTS[i]
+        i = (i + 1) & 7
+
+    if n > 1:
+        if d * d > n:
+            factors.append(n)
+        else:
+            _factor_large(n, factors)
+            factors.sort()
+    return factors
+
+
+def _factor_large(n: int, out: list[int]) -> None:
+    """Recursively split a large residual into primes via Brent's rho."""
+    if _is_prime(n):
+        out.append(n)
+        return
+    g = _brent_rho(n)
+    _factor_large(g, out)
+    _factor_large(n // g, out)
+
+
+def _brent_rho(n: int) -> int:
+    """Find a nontrivial factor of an odd composite n (Brent's cycle variant)."""
+    if n % 2 == 0:
+        return 2
+    rand = random.Random(n)
+    while True:
+        y = rand.randrange(1, n)
+        c = rand.randrange(1, n)
+        m = 128
+        g = r = q = 1
+        x = ys = y
+        while g == 1:
+            x = y
+            for _ in range(r):
+                y = (y * y + c) % n
+            k = 0
+            while k < r and g == 1:
+                ys = y
+                for _ in range(min(m, r - k)):
+                    y = (y * y + c) % n
+                    q = q * abs(x - y) % n
+                g = gcd(q, n)
+                k += m
+            r *= 2
+        if g == n:
+            g = 1
+            y = ys
+            while g == 1:
+                y = (y * y + c) % n
+                g = gcd(abs(x - y), n)
+        if g != n:
+            return g
@@ -6,11 +6,25 @@ Provides accurate Arabic letter counting with configurable rules.
 
 from __future__ import annotations
 
-from typing import Final
+import re
+import sys
+from collections import Counter
+from collections.abc import Sequence
+from functools import cache, lru_cache
+from typing import Final, NamedTuple
 
 from mizan.domain.enums import LetterCountMethod
 
 
+class LetterScan(NamedTuple):
+    """All per-text letter statistics from a single scan."""
+
+    base: int
+    wasla: int
+    khanjariyya: int
+    freq: dict[str, int]
+
+
 class LetterCounter:
     """
     Domain service for accurate Arabic letter counting.
@@ -22,16 +36,18 @@ class LetterCounter:
     - Diacritical marks (excluded from count)
     """
 
-    # Base Arabic letters (28 letters of the Arabic alphabet)
+    # Base Arabic letters (28 letters of the Arabic alphabet).
+    # Interned so every canonical letter object is shared process-wide and
+    # dict-key comparison can resolve on pointer identity.
     ARABIC_LETTERS: Final[frozenset[str]] = frozenset(
-        "ابتثجحخدذرزسشصضطظعغفقكلمنهويءآأؤإئى"  # Hamza variants and Alif Maqsura
+        map(sys.intern, "ابتثجحخدذرزسشصضطظعغفقكلمنهويءآأؤإئى")  # Hamza variants, Alif Maqsura
     )
 
     # Alif Wasla - used in Uthmani script for definite article
-    ALIF_WASLA: Final[str] = "\u0671"  # ٱ
+    ALIF_WASLA: Final[str] = sys.intern("\u0671")  # ٱ
 
     # Alif Khanjariyya - superscript Alif (counts as Alif per scholarly consensus)
-    ALIF_KHANJARIYYA: Final[str] = "\u0670"  # ـٰ
+    ALIF_KHANJARIYYA: Final[str] = sys.intern("\u0670")  # ـٰ
 
     # Combined countable special characters
     COUNTABLE_SPECIAL: Final[frozenset[str]] = frozenset([ALIF_WASLA, ALIF_KHANJARIYYA])
@@ -59,6 +75,13 @@ class LetterCounter:
     # Tatweel (kashida) - stretching character, NOT a letter
     TATWEEL: Final[str] = "\u0640"  # ـ
 
+    # Variant groups for normalization (class-level: set literals inside a
+    # method body are rebuilt on every call)
+    ALIF_VARIANTS: Final[frozenset[str]] = frozenset(
+        ["آ", "أ", "إ", "ا", ALIF_WASLA, ALIF_KHANJARIYYA]
+    )
+    YA_VARIANTS: Final[frozenset[str]] = frozenset(["ي", "ى", "ئ"])
+
     def count_letters(
         self,
         text: str,
@@ -85,20 +108,52 @@ class LetterCounter:
             - Spaces and punctuation are not counted
             - TRADITIONAL method gives: Basmalah=19, Al-Fatiha=139 (scholarly consensus)
         """
-        # Determine counting rules based on method or explicit overrides
+        # Fast path: no overrides means the rules — and therefore the
+        # deletion table — are fully determined by the method, so the
+        # pre-specialized table is one dict probe away.
+        if count_alif_wasla is None and count_alif_khanjariyya is None:
+            table = _METHOD_TABLES.get(method, _DEFAULT_TABLE)
+        else:
+            include_wasla, include_khanjariyya = self._get_counting_rules(
+                method, count_alif_wasla, count_alif_khanjariyya
+            )
+            table = _countable_deletion_table(include_wasla, include_khanjariyya)
+
+        # str.translate deletes every countable character in one C-level
+        # pass, so the count is just the length difference — no per-char
+        # Python loop or membership tests.
+        return len(text) - len(text.translate(table))
+
+    def count_letters_bulk(
+        self,
+        texts: Sequence[str],
+        method: LetterCountMethod = LetterCountMethod.TRADITIONAL,
+        *,
+        count_alif_wasla: bool | None = None,
+        count_alif_khanjariyya: bool | None = None,
+    ) -> list[int]:
+        """
+        Count Arabic letters in many texts with one rule resolution.
+
+        Batch counterpart of count_letters for corpus-scale passes
+        (ingestion, whole-Quran sweeps): the counting rules and the
+        deletion table are resolved once, then every text is a pair of
+        C-level scans inside a list comprehension.
+
+        Args:
+            texts: Arabic texts to count
+            method: Counting method (default: TRADITIONAL)
+            count_alif_wasla: Override for Alif Wasla counting
+            count_alif_khanjariyya: Override for Alif Khanjariyya counting
+
+        Returns:
+            Letter counts, index-aligned with the input texts
+        """
         include_wasla, include_khanjariyya = self._get_counting_rules(
             method, count_alif_wasla, count_alif_khanjariyya
         )
-
-        count = 0
-        for char in text:
-            if char in self.ARABIC_LETTERS:
-                count += 1
-            elif include_wasla and char == self.ALIF_WASLA:
-                count += 1
-            elif include_khanjariyya and char == self.ALIF_KHANJARIYYA:
-                count += 1
-        return count
+        table = _countable_deletion_table(include_wasla, include_khanjariyya)
+        return [len(text) - len(text.translate(table)) for text in texts]
 
     def _get_counting_rules(
         self,
@@ -113,30 +168,7 @@ class LetterCounter:
         - This equals Uthmani base (125) + Alif Wasla (14) = 139
         - Alif Khanjariyya (6) is NOT counted in traditional scholarship
         """
-        # Default rules per method (wasla, khanjariyya)
-        method_rules = {
-            # TRADITIONAL: Include Wasla (as Alif), exclude Khanjariyya
-            # Verified: Al-Fatiha = 139 letters (scholarly consensus)
-            LetterCountMethod.TRADITIONAL: (True, False),
-            # UTHMANI_FULL: Include all Alif variants
-            # Al-Fatiha = 145 letters with this method
-            LetterCountMethod.UTHMANI_FULL: (True, True),
-            # NO_WASLA: Base letters only (for simple text analysis)
-            # Use this when working with simple/imlai text
-            LetterCountMethod.NO_WASLA: (False, False),
-        }
-        include_wasla, include_khanjariyya = method_rules.get(
-            method,
-            (True, False),  # Default to TRADITIONAL
-        )
-
-        # Apply explicit overrides if provided
-        if wasla_override is not None:
-            include_wasla = wasla_override
-        if khanjariyya_override is not None:
-            include_khanjariyya = khanjariyya_override
-
-        return include_wasla, include_khanjariyya
+        return _counting_rules(method, wasla_override, khanjariyya_override)
 
     def count_letters_detailed(
         self,
@@ -166,17 +198,7 @@ class LetterCounter:
             method, count_alif_wasla, count_alif_khanjariyya
         )
 
-        base = 0
-        wasla = 0
-        khanjariyya = 0
-
-        for char in text:
-            if char in self.ARABIC_LETTERS:
-                base += 1
-            elif char == self.ALIF_WASLA:
-                wasla += 1
-            elif char == self.ALIF_KHANJARIYYA:
-                khanjariyya += 1
+        base, wasla, khanjariyya, _ = self.scan(text)
 
         total = base
         if include_wasla:
@@ -194,6 +216,28 @@ class LetterCounter:
             "khanjariyya_included": include_khanjariyya,
         }
 
+    def scan(self, text: str) -> LetterScan:
+        """
+        Compute all letter statistics in one pass over the text.
+
+        Single-scan primitive for callers that want more than one result
+        (e.g. a report needing both the count and the frequency table):
+        one countable filter + Counter pass yields the base-letter count,
+        both special-Alif counts and the raw frequency table together.
+
+        Args:
+            text: Arabic text to scan
+
+        Returns:
+            LetterScan with base/wasla/khanjariyya counts and the
+            unnormalized letter frequency
+        """
+        freq = dict(Counter(_NON_COUNTABLE_RE.sub("", text)))
+        wasla = freq.get(self.ALIF_WASLA, 0)
+        khanjariyya = freq.get(self.ALIF_KHANJARIYYA, 0)
+        base = sum(freq.values()) - wasla - khanjariyya
+        return LetterScan(base=base, wasla=wasla, khanjariyya=khanjariyya, freq=freq)
+
     def get_letter_frequency(
         self,
         text: str,
@@ -209,12 +253,12 @@ class LetterCounter:
         Returns:
             Dictionary mapping letters to their counts
         """
-        freq: dict[str, int] = {}
-        for char in text:
-            if char in self.ARABIC_LETTERS or char in self.COUNTABLE_SPECIAL:
-                letter = self._normalize_letter(char) if normalize_variants else char
-                freq[letter] = freq.get(letter, 0) + 1
-        return freq
+        # Normalize via one translate pass, strip non-countables with the
+        # compiled class scan, then let Counter's C-level counting loop do
+        # the accumulation — no per-char Python dispatch at all.
+        if normalize_variants:
+            text = text.translate(_VARIANT_NORMALIZE_TABLE)
+        return dict(Counter(_NON_COUNTABLE_RE.sub("", text)))
 
     def _normalize_letter(self, char: str) -> str:
         """
@@ -224,21 +268,18 @@ class LetterCounter:
         - All Ya variants → ي
         - Hamza stays as ء
         """
-        # Alif variants
-        ALIF_VARIANTS = frozenset(["آ", "أ", "إ", "ا", self.ALIF_WASLA, self.ALIF_KHANJARIYYA])
-        if char in ALIF_VARIANTS:
+        if char in self.ALIF_VARIANTS:
             return "ا"
-
-        # Ya variants
-        YA_VARIANTS = frozenset(["ي", "ى", "ئ"])
-        if char in YA_VARIANTS:
+        if char in self.YA_VARIANTS:
             return "ي"
-
         return char
 
     def is_arabic_letter(self, char: str) -> bool:
         """Check if a character is an Arabic letter."""
-        return char in self.ARABIC_LETTERS or char in self.COUNTABLE_SPECIAL
+        if len(char) != 1:
+            return False
+        cp = ord(char)
+        return cp < _CLASS_TABLE_SIZE and bool(_CLASS_TABLE[cp] & _COUNTABLE_MASK)
 
     def extract_letters(self, text: str) -> str:
         """
@@ -246,6 +287,95 @@ class LetterCounter:
 
         Removes diacritics, spaces, punctuation - returns only letters.
         """
-        return "".join(
-            char for char in text if char in self.ARABIC_LETTERS or char in self.COUNTABLE_SPECIAL
-        )
+        return _NON_COUNTABLE_RE.sub("", text)
+
+
+# Default rules per method (wasla, khanjariyya):
+# TRADITIONAL includes Wasla (as Alif), excludes Khanjariyya — verified
+# Al-Fatiha = 139 letters (scholarly consensus). UTHMANI_FULL includes all
+# Alif variants (Al-Fatiha = 145). NO_WASLA counts base letters only, for
+# simple/imlai text analysis.
+_METHOD_RULES: Final[dict[LetterCountMethod, tuple[bool, bool]]] = {
+    LetterCountMethod.TRADITIONAL: (True, False),
+    LetterCountMethod.UTHMANI_FULL: (True, True),
+    LetterCountMethod.NO_WASLA: (False, False),
+}
+
+
+@cache
+def _counting_rules(
+    method: LetterCountMethod,
+    wasla_override: bool | None,
+    khanjariyya_override: bool | None,
+) -> tuple[bool, bool]:
+    """Memoized rule resolution — the input space is a handful of tuples."""
+    include_wasla, include_khanjariyya = _METHOD_RULES.get(
+        method,
+        (True, False),  # Default to TRADITIONAL
+    )
+    if wasla_override is not None:
+        include_wasla = wasla_override
+    if khanjariyya_override is not None:
+        include_khanjariyya = khanjariyya_override
+    return include_wasla, include_khanjariyya
+
+
+@lru_cache(maxsize=4)
+def _countable_deletion_table(
+    include_wasla: bool,
+    include_khanjariyya: bool,
+) -> dict[int, None]:
+    """Cached str.translate table deleting every countable character."""
+    countable = set(LetterCounter.ARABIC_LETTERS)
+    if include_wasla:
+        countable.add(LetterCounter.ALIF_WASLA)
+    if include_khanjariyya:
+        countable.add(LetterCounter.ALIF_KHANJARIYYA)
+    return str.maketrans(dict.fromkeys(countable))
+
+
+# Per-method specialized deletion tables: the common no-override calls
+# skip rule resolution entirely.
+_METHOD_TABLES: Final[dict[LetterCountMethod, dict[int, None]]] = {
+    method: _countable_deletion_table(*rules) for method, rules in _METHOD_RULES.items()
+}
+_DEFAULT_TABLE: Final[dict[int, None]] = _METHOD_TABLES[LetterCountMethod.TRADITIONAL]
+
+# C-level scan stripping everything that is not a countable letter.
+_NON_COUNTABLE_RE: Final[re.Pattern[str]] = re.compile(
+    "[^"
+    + re.escape("".join(LetterCounter.ARABIC_LETTERS | LetterCounter.COUNTABLE_SPECIAL))
+    + "]"
+)
+
+# One-pass variant normalization for frequency counting (variants are all
+# countable, so translating before the countable filter is equivalent).
+_VARIANT_NORMALIZE_TABLE: Final[dict[int, str]] = str.maketrans(
+    dict.fromkeys(LetterCounter.ALIF_VARIANTS, "ا")
+    | dict.fromkeys(LetterCounter.YA_VARIANTS, "ي")
+)
+
+# Character-class bitmask bits for the flat lookup table below.
+_LETTER_MASK: Final[int] = 1
+_WASLA_MASK: Final[int] = 2
+_KHANJARIYYA_MASK: Final[int] = 4
+_TASHKEEL_MASK: Final[int] = 8
+_COUNTABLE_MASK: Final[int] = _LETTER_MASK | _WASLA_MASK | _KHANJARIYYA_MASK
+
+
+def _build_class_table() -> bytes:
+    """Flat per-codepoint class bitmap covering the Arabic block."""
+    table = bytearray(0x0700)
+    for char in LetterCounter.ARABIC_LETTERS:
+        table[ord(char)] |= _LETTER_MASK
+    table[ord(LetterCounter.ALIF_WASLA)] |= _WASLA_MASK
+    table[ord(LetterCounter.ALIF_KHANJARIYYA)] |= _KHANJARIYYA_MASK
+    for char in LetterCounter.TASHKEEL:
+        table[ord(char)] |= _TASHKEEL_MASK
+    return bytes(table)
+
+
+# Classifying a char is one ord, one index and one mask test — no hashing.
+# Codepoints beyond the table (non-Arabic) are simply not classified.
+_CLASS_TABLE: Final[bytes] = _build_class_table()
+_CLASS_TABLE_SIZE: Final[int] = len(_CLASS_TABLE)
@@ -6,11 +6,12 @@ Provides transparent word counting with full methodology logging.
 
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
 from typing import Final
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WordCountResult:
     """
     Result of a word count operation with full transparency.
@@ -91,23 +92,16 @@ class WordCounter:
         """
         decisions: list[str] = []
 
-        # Remove non-word characters
-        cleaned = text
+        # Tokenize with one compiled character-class scan: the pattern
+        # excludes whitespace and every non-word mark, so splitting and
+        # mark removal happen in a single C-level pass. The audit trail
+        # still records which marks were present.
         for char in self.NON_WORD_CHARS:
-            if char in cleaned:
-                cleaned = cleaned.replace(char, " ")
+            if char in text:
                 decisions.append(f"Removed {repr(char)} (non-word character)")
 
-        # Split by whitespace
-        raw_words = cleaned.split()
-        decisions.append(f"Split text into {len(raw_words)} raw tokens")
-
-        # Filter empty strings and clean words
-        words: list[str] = []
-        for word in raw_words:
-            word = word.strip()
-            if word:
-                words.append(word)
+        words = _TOKEN_RE.findall(text)
+        decisions.append(f"Split text into {len(words)} raw tokens")
 
         # Build methodology description
         methodology = "Whitespace-delimited word counting"
@@ -148,25 +142,21 @@ class WordCounter:
         Returns:
             List of (word, start_index, end_index) tuples
         """
-        positions: list[tuple[str, int, int]] = []
-        current_word_start: int | None = None
-        current_word: list[str] = []
-
-        for i, char in enumerate(text):
-            if char in self.WORD_SEPARATORS or char in self.NON_WORD_CHARS:
-                if current_word:
-                    word = "".join(current_word)
-                    positions.append((word, current_word_start or 0, i))
-                    current_word = []
-                    current_word_start = None
-            else:
-                if current_word_start is None:
-                    current_word_start = i
-                current_word.append(char)
-
-        # Handle last word
-        if current_word:
-            word = "".join(current_word)
-            positions.append((word, current_word_start or 0, len(text)))
-
-        return positions
+        return [
+            (match.group(0), match.start(), match.end())
+            for match in _POSITION_TOKEN_RE.finditer(text)
+        ]
+
+
+# Token patterns: a word is a maximal run of non-boundary characters.
+# count_words historically split on all whitespace, while
+# get_word_positions recognizes only the explicit WORD_SEPARATORS — the
+# two compiled classes preserve that distinction.
+_TOKEN_RE: Final[re.Pattern[str]] = re.compile(
+    r"[^\s" + re.escape("".join(WordCounter.NON_WORD_CHARS)) + "]+"
+)
+_POSITION_TOKEN_RE: Final[re.Pattern[str]] = re.compile(
+    "[^"
+    + re.escape("".join(WordCounter.WORD_SEPARATORS | WordCounter.NON_WORD_CHARS))
+    + "]+"
+)
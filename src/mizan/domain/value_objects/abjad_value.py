@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from collections import defaultdict
+from dataclasses import dataclass, field
+from operator import itemgetter
+from typing import TYPE_CHECKING, Final
 
 if TYPE_CHECKING:
     from mizan.domain.enums import AbjadSystem
 
+_second = itemgetter(1)
+
 
 @dataclass(frozen=True, slots=True)
 class AbjadValue:
@@ -28,18 +32,48 @@ class AbjadValue:
     value: int
     letter_breakdown: tuple[tuple[str, int], ...]
 
+    # Lazily computed result caches: the value object is frozen, so both
+    # answers are fixed at construction and worth keeping once derived.
+    _is_prime_cache: bool | None = field(default=None, init=False, repr=False, compare=False)
+    _breakdown_dict_cache: dict[str, int] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     def __post_init__(self) -> None:
         """Validate the Abjad value."""
         if self.value < 0:
             raise ValueError(f"Abjad value cannot be negative: {self.value}")
 
-        # Verify breakdown sums to total
-        computed_sum = sum(v for _, v in self.letter_breakdown)
+        # Verify breakdown sums to total (map/sum run in C, unlike a
+        # Python generator expression)
+        computed_sum = sum(map(_second, self.letter_breakdown))
         if computed_sum != self.value:
             raise ValueError(
                 f"Letter breakdown sum ({computed_sum}) does not match value ({self.value})"
             )
 
+    @classmethod
+    def _trusted(
+        cls,
+        system: AbjadSystem,
+        value: int,
+        letter_breakdown: tuple[tuple[str, int], ...],
+    ) -> AbjadValue:
+        """
+        Construct without re-validating the breakdown sum.
+
+        For callers that just computed the total from the breakdown
+        themselves (the Abjad calculator), __post_init__'s re-sum is pure
+        duplicated work — this bypasses it via direct slot assignment.
+        """
+        obj = object.__new__(cls)
+        object.__setattr__(obj, "system", system)
+        object.__setattr__(obj, "value", value)
+        object.__setattr__(obj, "letter_breakdown", letter_breakdown)
+        object.__setattr__(obj, "_is_prime_cache", None)
+        object.__setattr__(obj, "_breakdown_dict_cache", None)
+        return obj
+
     def __str__(self) -> str:
         """Return the numerical value as string."""
         return str(self.value)
@@ -70,12 +104,21 @@ class AbjadValue:
 
         Note: If a letter appears multiple times, values are summed.
 
+        The result is computed once and cached (the value object is
+        frozen) — treat the returned dictionary as immutable.
+
         Returns:
             Dictionary mapping letters to their total contribution
         """
-        result: dict[str, int] = {}
-        for letter, val in self.letter_breakdown:
-            result[letter] = result.get(letter, 0) + val
+        result = self._breakdown_dict_cache
+        if result is None:
+            # defaultdict resolves each letter with one hash probe; the
+            # get-or-0 pattern costs two.
+            totals: defaultdict[str, int] = defaultdict(int)
+            for letter, val in self.letter_breakdown:
+                totals[letter] += val
+            result = dict(totals)
+            object.__setattr__(self, "_breakdown_dict_cache", result)
         return result
 
     def get_letter_count(self) -> int:
@@ -83,17 +126,27 @@ class AbjadValue:
         return len(self.letter_breakdown)
 
     def is_prime(self) -> bool:
-        """Check if the Abjad value is a prime number."""
-        if self.value < 2:
-            return False
-        if self.value == 2:
-            return True
-        if self.value % 2 == 0:
-            return False
-        for i in range(3, int(self.value**0.5) + 1, 2):
-            if self.value % i == 0:
-                return False
-        return True
+        """
+        Check if the Abjad value is a prime number.
+
+        Values within the sieve range (anything a surah can reach) answer
+        with a single byte load from a lazily built Eratosthenes sieve;
+        larger values fall back to trial division. The answer is cached
+        on the instance after the first call.
+        """
+        cached = self._is_prime_cache
+        if cached is not None:
+            return cached
+
+        value = self.value
+        if value < _SIEVE_LIMIT:
+            result = bool(_prime_sieve()[value])
+        elif value % 2 == 0:
+            result = False
+        else:
+            result = all(value % i for i in range(3, int(value**0.5) + 1, 2))
+        object.__setattr__(self, "_is_prime_cache", result)
+        return result
 
     def modulo(self, divisor: int) -> int:
         """
@@ -125,3 +178,23 @@ class AbjadValue:
         if self.value == 0:
             return 0
         return 1 + (self.value - 1) % 9
+
+
+# Covers any realistic per-text Abjad total (whole surahs included);
+# ~1MB once built, built only if is_prime is ever called.
+_SIEVE_LIMIT: Final[int] = 1_000_000
+_PRIME_SIEVE: bytearray | None = None
+
+
+def _prime_sieve() -> bytearray:
+    """Lazily build and return the shared Eratosthenes sieve."""
+    global _PRIME_SIEVE
+    if _PRIME_SIEVE is None:
+        sieve = bytearray(b"\x01") * _SIEVE_LIMIT
+        sieve[0:2] = b"\x00\x00"
+        for p in range(2, int(_SIEVE_LIMIT**0.5) + 1):
+            if sieve[p]:
+                # C-level slice assignment knocks out all multiples at once.
+                sieve[p * p :: p] = b"\x00" * len(range(p * p, _SIEVE_LIMIT, p))
+        _PRIME_SIEVE = sieve
+    return _PRIME_SIEVE
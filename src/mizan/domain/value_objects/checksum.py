@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import hashlib
 import hmac
+from collections.abc import Callable, Iterable, Sequence
 from dataclasses import dataclass
 from typing import Final
 
@@ -20,6 +21,16 @@ SUPPORTED_ALGORITHMS: Final[frozenset[str]] = frozenset(
 
 DEFAULT_ALGORITHM: Final[str] = "sha256"
 
+# Direct constructors: hashlib.new() re-dispatches on the algorithm name
+# string every call, which is measurable at per-verse call rates.
+_HASHER_FACTORIES: Final[dict[str, Callable[..., hashlib._Hash]]] = {
+    "sha256": hashlib.sha256,
+    "sha384": hashlib.sha384,
+    "sha512": hashlib.sha512,
+    "sha3_256": hashlib.sha3_256,
+    "sha3_512": hashlib.sha3_512,
+}
+
 
 @dataclass(frozen=True, slots=True)
 class TextChecksum:
@@ -56,6 +67,22 @@ class TextChecksum:
                 f"Invalid checksum value: must be hex-encoded. Got: {self.value[:20]}..."
             ) from e
 
+    @classmethod
+    def _trusted(cls, algorithm: str, value: str) -> TextChecksum:
+        """
+        Construct without re-validating algorithm and hex format.
+
+        For the compute* paths, whose values come straight from
+        hexdigest() of an already-validated algorithm, __post_init__'s
+        hex parse is pure duplicated work — this bypasses it via direct
+        slot assignment. External input still goes through the normal
+        validating constructor.
+        """
+        obj = object.__new__(cls)
+        object.__setattr__(obj, "algorithm", algorithm)
+        object.__setattr__(obj, "value", value)
+        return obj
+
     def __str__(self) -> str:
         """Return algorithm:hash format."""
         return f"{self.algorithm}:{self.value}"
@@ -77,15 +104,87 @@ class TextChecksum:
         Returns:
             TextChecksum instance with computed hash
         """
-        if algorithm not in SUPPORTED_ALGORITHMS:
+        factory = _HASHER_FACTORIES.get(algorithm)
+        if factory is None:
             raise ValueError(
                 f"Unsupported algorithm: {algorithm}. "
                 f"Supported: {', '.join(sorted(SUPPORTED_ALGORITHMS))}"
             )
 
-        hasher = hashlib.new(algorithm)
+        hasher = factory()
         hasher.update(text.encode("utf-8"))
-        return cls(algorithm=algorithm, value=hasher.hexdigest())
+        return cls._trusted(algorithm, hasher.hexdigest())
+
+    @classmethod
+    def compute_bulk(
+        cls,
+        chunks: Iterable[str],
+        algorithm: str = DEFAULT_ALGORITHM,
+        separator: str = "\n",
+    ) -> TextChecksum:
+        """
+        Compute one checksum over many text chunks without joining them.
+
+        Equivalent to compute(separator.join(chunks)) but feeds a single
+        hasher incrementally, so a corpus-wide checksum never materializes
+        the joined text in memory.
+
+        Args:
+            chunks: Text chunks to hash in order
+            algorithm: Hash algorithm to use (default: sha256)
+            separator: Separator hashed between chunks (default: newline)
+
+        Returns:
+            TextChecksum instance with computed hash
+        """
+        factory = _HASHER_FACTORIES.get(algorithm)
+        if factory is None:
+            raise ValueError(
+                f"Unsupported algorithm: {algorithm}. "
+                f"Supported: {', '.join(sorted(SUPPORTED_ALGORITHMS))}"
+            )
+
+        hasher = factory()
+        sep = separator.encode("utf-8")
+        first = True
+        for chunk in chunks:
+            if not first:
+                hasher.update(sep)
+            hasher.update(chunk.encode("utf-8"))
+            first = False
+        return cls._trusted(algorithm, hasher.hexdigest())
+
+    @classmethod
+    def compute_many(
+        cls,
+        texts: Sequence[str],
+        algorithm: str = DEFAULT_ALGORITHM,
+    ) -> list[TextChecksum]:
+        """
+        Compute independent checksums for many texts in one batch.
+
+        Resolves the hasher constructor and validates the algorithm once
+        for the whole batch; each text is then a single constructor call
+        on its encoded bytes. Intended for per-verse checksumming during
+        ingestion.
+
+        Args:
+            texts: Texts to hash
+            algorithm: Hash algorithm to use (default: sha256)
+
+        Returns:
+            TextChecksums, index-aligned with the input texts
+        """
+        factory = _HASHER_FACTORIES.get(algorithm)
+        if factory is None:
+            raise ValueError(
+                f"Unsupported algorithm: {algorithm}. "
+                f"Supported: {', '.join(sorted(SUPPORTED_ALGORITHMS))}"
+            )
+        return [
+            cls._trusted(algorithm, factory(text.encode("utf-8")).hexdigest())
+            for text in texts
+        ]
 
     @classmethod
     def from_string(cls, checksum_str: str) -> TextChecksum:
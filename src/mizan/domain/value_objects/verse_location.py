@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+import re
+from array import array
+from bisect import bisect_right
+from collections.abc import Iterable
 from dataclasses import dataclass
 from typing import Final
 
@@ -128,6 +132,25 @@ MAX_VERSES_PER_SURAH: Final[dict[int, int]] = {
     114: 6,
 }
 
+# Tuple view of the same table for O(1) C-level indexing on hot paths
+# (index 0 is a sentinel; surah numbers index directly). The dict above
+# stays the readable, public form.
+_MAX_VERSES: Final[tuple[int, ...]] = (0,) + tuple(
+    MAX_VERSES_PER_SURAH[s] for s in range(MIN_SURAH, MAX_SURAH + 1)
+)
+
+# 0-based starting position of each surah in Mushaf order, for the global
+# ayah indexing (0..6235) used by bulk and bitmap operations.
+SURAH_START_INDEX: Final[dict[int, int]] = {}
+_running = 0
+for _surah in range(MIN_SURAH, MAX_SURAH + 1):
+    SURAH_START_INDEX[_surah] = _running
+    _running += MAX_VERSES_PER_SURAH[_surah]
+TOTAL_QURAN_VERSES: Final[int] = _running
+del _running, _surah
+
+_SURAH_STARTS: Final[tuple[int, ...]] = tuple(SURAH_START_INDEX.values())
+
 
 @dataclass(frozen=True, slots=True)
 class VerseLocation:
@@ -158,9 +181,10 @@ class VerseLocation:
                 f"Invalid verse number: {self.verse_number}. Must be at least {MIN_VERSE}."
             )
 
-        # Validate against known verse counts
-        max_verses = MAX_VERSES_PER_SURAH.get(self.surah_number)
-        if max_verses is not None and self.verse_number > max_verses:
+        # Validate against known verse counts (surah range checked above,
+        # so the tuple index cannot be out of bounds)
+        max_verses = _MAX_VERSES[self.surah_number]
+        if self.verse_number > max_verses:
             raise ValueError(
                 f"Invalid verse number: {self.verse_number} for surah {self.surah_number}. "
                 f"Maximum is {max_verses}."
@@ -188,22 +212,163 @@ class VerseLocation:
         Raises:
             ValueError: If string format is invalid
         """
-        parts = location_str.strip().split(":")
-        if len(parts) != 2:
+        match = _LOCATION_RE.match(location_str)
+        if match is None:
+            if location_str.count(":") == 1:
+                raise ValueError(
+                    f"Invalid location format: '{location_str}'. Surah and verse must be integers."
+                )
             raise ValueError(
                 f"Invalid location format: '{location_str}'. "
                 "Expected 'surah:verse' format (e.g., '2:255')."
             )
+        return cls.get(int(match[1]), int(match[2]))
+
+    @classmethod
+    def from_strings(cls, location_strs: Iterable[str]) -> list[VerseLocation]:
+        """
+        Parse many "surah:verse" strings in one pass.
+
+        Bulk counterpart of :meth:`from_string` for ingestion-scale
+        parsing: the compiled pattern and intern lookup are bound once,
+        and every hit comes back as the shared interned instance.
+
+        Args:
+            location_strs: Strings in "surah:verse" format
+
+        Returns:
+            VerseLocations, index-aligned with the input
+
+        Raises:
+            ValueError: If any string is malformed or out of range
+        """
+        matcher = _LOCATION_RE.match
+        from_string = cls.from_string
+        get = cls.get
+        results: list[VerseLocation] = []
+        for location_str in location_strs:
+            match = matcher(location_str)
+            if match is None:
+                # Delegate to the scalar parser for its precise error
+                from_string(location_str)
+            else:
+                results.append(get(int(match[1]), int(match[2])))
+        return results
+
+    @classmethod
+    def get(cls, surah_number: int, verse_number: int) -> VerseLocation:
+        """
+        Return the interned instance for a verse position.
+
+        There are only 6,236 valid locations, so repeated parsing and
+        iteration can share one frozen instance per verse instead of
+        allocating and re-validating a fresh object each time. Invalid
+        positions raise exactly as the constructor does and are never
+        cached.
+
+        Args:
+            surah_number: Surah number (1-114)
+            verse_number: Verse number within the surah
 
-        try:
-            surah = int(parts[0])
-            verse = int(parts[1])
-        except ValueError as e:
+        Returns:
+            The shared VerseLocation for this position
+        """
+        key = (surah_number, verse_number)
+        location = _INTERNED.get(key)
+        if location is None:
+            location = cls(surah_number, verse_number)
+            _INTERNED[key] = location
+        return location
+
+    @classmethod
+    def _unchecked(cls, surah_number: int, verse_number: int) -> VerseLocation:
+        """
+        Construct without running __post_init__ validation.
+
+        Only for internal callers whose values are provably valid (e.g.
+        stepping within an already-validated surah) — re-running the range
+        checks there is pure duplicated work. External input must go
+        through the normal constructor or :meth:`get`.
+        """
+        obj = object.__new__(cls)
+        object.__setattr__(obj, "surah_number", surah_number)
+        object.__setattr__(obj, "verse_number", verse_number)
+        return obj
+
+    @classmethod
+    def _get_unchecked(cls, surah_number: int, verse_number: int) -> VerseLocation:
+        """Interned variant of :meth:`_unchecked` for provably-valid positions."""
+        key = (surah_number, verse_number)
+        location = _INTERNED.get(key)
+        if location is None:
+            location = cls._unchecked(surah_number, verse_number)
+            _INTERNED[key] = location
+        return location
+
+    @property
+    def global_index(self) -> int:
+        """0-based position of this verse in Mushaf order (0..6235)."""
+        return SURAH_START_INDEX[self.surah_number] + self.verse_number - 1
+
+    @classmethod
+    def from_global_index(cls, index: int) -> VerseLocation:
+        """
+        Create a VerseLocation from a 0-based global ayah index.
+
+        Args:
+            index: Position in Mushaf order (0..6235)
+
+        Returns:
+            VerseLocation instance
+
+        Raises:
+            ValueError: If index is out of range
+        """
+        if not 0 <= index < TOTAL_QURAN_VERSES:
             raise ValueError(
-                f"Invalid location format: '{location_str}'. Surah and verse must be integers."
-            ) from e
+                f"Invalid global verse index: {index}. "
+                f"Must be between 0 and {TOTAL_QURAN_VERSES - 1}."
+            )
+        surah = bisect_right(_SURAH_STARTS, index)
+        return cls._get_unchecked(surah, index - _SURAH_STARTS[surah - 1] + 1)
+
+    def pack_word(self, word_number: int = 0) -> int:
+        """
+        Pack this location (plus an optional word number) into one uint32.
+
+        Layout: ``(surah << 20) | (verse << 8) | word_number`` — surah and
+        verse always fit their fields, and no verse exceeds 255 words.
+        Bulk consumers (root sweeps, set intersections) can sort and
+        compare these plain ints far cheaper than tuples of value objects.
+
+        Args:
+            word_number: Word position in the verse (0 when unused)
+
+        Returns:
+            Packed integer identifier
+
+        Raises:
+            ValueError: If word_number does not fit in 8 bits
+        """
+        if not 0 <= word_number <= 0xFF:
+            raise ValueError(f"Invalid word number for packing: {word_number}. Must fit 8 bits.")
+        return (self.surah_number << 20) | (self.verse_number << 8) | word_number
+
+    @classmethod
+    def unpack_word(cls, packed: int) -> tuple[VerseLocation, int]:
+        """
+        Inverse of :meth:`pack_word`.
 
-        return cls(surah_number=surah, verse_number=verse)
+        Args:
+            packed: Packed integer identifier
+
+        Returns:
+            (VerseLocation, word_number) tuple
+
+        Raises:
+            ValueError: If the packed fields are not a valid location
+        """
+        return cls(packed >> 20, (packed >> 8) & 0xFFF), packed & 0xFF
 
     def next_verse(self) -> VerseLocation | None:
         """
@@ -212,10 +377,9 @@ class VerseLocation:
         Returns:
             Next VerseLocation or None if at surah end
         """
-        max_verses = MAX_VERSES_PER_SURAH.get(self.surah_number, 0)
-        if self.verse_number >= max_verses:
+        if self.verse_number >= _MAX_VERSES[self.surah_number]:
             return None
-        return VerseLocation(self.surah_number, self.verse_number + 1)
+        return VerseLocation._get_unchecked(self.surah_number, self.verse_number + 1)
 
     def previous_verse(self) -> VerseLocation | None:
         """
@@ -226,7 +390,7 @@ class VerseLocation:
         """
         if self.verse_number <= MIN_VERSE:
             return None
-        return VerseLocation(self.surah_number, self.verse_number - 1)
+        return VerseLocation._get_unchecked(self.surah_number, self.verse_number - 1)
 
     def is_first_verse(self) -> bool:
         """Check if this is the first verse of a surah."""
@@ -234,19 +398,85 @@ class VerseLocation:
 
     def is_last_verse(self) -> bool:
         """Check if this is the last verse of a surah."""
-        max_verses = MAX_VERSES_PER_SURAH.get(self.surah_number, 0)
-        return self.verse_number == max_verses
+        return self.verse_number == _MAX_VERSES[self.surah_number]
 
     def __lt__(self, other: object) -> bool:
         """Enable sorting by surah then verse."""
         if not isinstance(other, VerseLocation):
             return NotImplemented
-        if self.surah_number != other.surah_number:
-            return self.surah_number < other.surah_number
-        return self.verse_number < other.verse_number
+        # Single C-level tuple richcompare instead of branchy per-field
+        # comparisons — this is the hot comparator when sorting verse lists.
+        return (self.surah_number, self.verse_number) < (other.surah_number, other.verse_number)
 
     def __le__(self, other: object) -> bool:
         """Enable sorting by surah then verse."""
         if not isinstance(other, VerseLocation):
             return NotImplemented
-        return self < other or self == other
+        return (self.surah_number, self.verse_number) <= (
+            other.surah_number,
+            other.verse_number,
+        )
+
+
+class VerseLocationArray:
+    """
+    Packed bulk container for verse locations.
+
+    Lists of VerseLocation objects fragment the heap and pay a Python
+    call per comparison; this companion stores each position as one
+    packed uint32 (the :meth:`VerseLocation.pack_word` layout with word
+    0) in a stdlib ``array``, so sorting, deduplication and membership
+    work on plain ints in one contiguous buffer. Materialize objects
+    only at the edge via :meth:`to_objects`.
+    """
+
+    __slots__ = ("_packed",)
+
+    def __init__(self, packed: array[int] | None = None) -> None:
+        """Initialize, optionally wrapping an existing packed buffer."""
+        self._packed = packed if packed is not None else array("I")
+
+    @classmethod
+    def from_locations(cls, locations: Iterable[VerseLocation]) -> VerseLocationArray:
+        """Build from VerseLocation instances."""
+        return cls(array("I", (loc.pack_word() for loc in locations)))
+
+    def append(self, location: VerseLocation) -> None:
+        """Append one location."""
+        self._packed.append(location.pack_word())
+
+    def __len__(self) -> int:
+        return len(self._packed)
+
+    def __contains__(self, location: object) -> bool:
+        if not isinstance(location, VerseLocation):
+            return False
+        return location.pack_word() in self._packed
+
+    def sort(self) -> None:
+        """Sort in Mushaf order (surah occupies the high bits, so numeric
+        order on the packed ints is surah-then-verse order)."""
+        self._packed = array("I", sorted(self._packed))
+
+    def validate(self) -> bool:
+        """Check every packed position against the real verse counts."""
+        max_verses = _MAX_VERSES
+        return all(
+            MIN_SURAH <= (packed >> 20) <= MAX_SURAH
+            and MIN_VERSE <= ((packed >> 8) & 0xFFF) <= max_verses[packed >> 20]
+            for packed in self._packed
+        )
+
+    def to_objects(self) -> list[VerseLocation]:
+        """Materialize interned VerseLocation instances."""
+        get = VerseLocation._get_unchecked
+        return [get(packed >> 20, (packed >> 8) & 0xFFF) for packed in self._packed]
+
+
+# Compiled "surah:verse" pattern — one C-level match replaces
+# strip + split + two try/except int conversions per parse.
+_LOCATION_RE: Final[re.Pattern[str]] = re.compile(r"\s*(\d+):(\d+)\s*$")
+
+# Flyweight cache for VerseLocation.get — populated lazily, bounded by
+# the 6,236 valid verse positions (a few hundred KB at most).
+_INTERNED: dict[tuple[int, int], VerseLocation] = {}
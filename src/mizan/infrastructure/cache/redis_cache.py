@@ -4,14 +4,44 @@ Redis cache implementation for analysis results.
 Provides async caching with configurable TTL.
 """
 
+import asyncio
 import json
 from collections.abc import Awaitable
-from typing import Any
+from typing import Any, Final
 
 import redis.asyncio as redis
 
 from mizan.infrastructure.config import get_settings
 
+# Pre-instantiated encoder: json.dumps(..., ensure_ascii=False) builds a
+# fresh JSONEncoder on every call (only the all-defaults path reuses the
+# module-level one). Compact separators also shrink the cached payload.
+_json_dumps: Final = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+# All-defaults loads already reuses json's cached decoder; bind it once
+# to skip the module attribute lookup on the hot path.
+_json_loads: Final = json.loads
+
+# SCAN COUNT hint and UNLINK batch size for namespace clears: bounds both
+# per-iteration server work and client-side key buffering.
+_SCAN_BATCH_SIZE: Final[int] = 500
+
+# Atomic get-or-claim for get_or_set: one round-trip either returns the
+# cached value, claims the computation slot ('' — the caller computes),
+# or reports another worker already claimed it (nil — the caller polls).
+# The claim expires so a crashed claimant cannot poison the key.
+_GET_OR_CLAIM_LUA: Final[str] = """
+local v = redis.call('GET', KEYS[1])
+if v then return v end
+if redis.call('SET', KEYS[1], ARGV[2], 'NX', 'EX', ARGV[1]) then return '' end
+return false
+"""
+
+# Sentinel stored while a worker computes; polled by other workers.
+_PENDING_SENTINEL: Final[str] = "__mizan:pending__"
+_CLAIM_TTL_SECONDS: Final[int] = 30
+_CLAIM_POLL_INTERVAL: Final[float] = 0.05
+_CLAIM_POLL_ATTEMPTS: Final[int] = 40
+
 
 class RedisCache:
     """
@@ -27,26 +57,41 @@ class RedisCache:
         """Initialize with Redis client."""
         self._redis = redis_client
         self._settings = get_settings()
+        # Frozen per-instance hot-path values: settings never change after
+        # startup, so re-reading them (and rebuilding key prefixes) on
+        # every get/set is avoidable attribute and f-string work.
+        self._default_ttl = self._settings.cache_ttl
+        self._ns_prefixes: dict[str, str] = {}
+        # In-flight fire-and-forget writes, drained on close()
+        self._pending_writes: set[asyncio.Task[None]] = set()
+        self._get_or_claim = redis_client.register_script(_GET_OR_CLAIM_LUA)
 
     @classmethod
     async def create(cls) -> "RedisCache":
-        """Create a new RedisCache instance."""
-        settings = get_settings()
-        client = redis.from_url(
-            settings.redis_url,
-            encoding="utf-8",
-            decode_responses=True,
-            max_connections=settings.redis_pool_size,
-        )
-        return cls(client)
+        """Create a new RedisCache instance on the shared connection pool."""
+        return cls(redis.Redis(connection_pool=_get_pool()))
 
     async def close(self) -> None:
-        """Close the Redis connection."""
+        """Close the Redis connection, draining any in-flight writes."""
+        if self._pending_writes:
+            await asyncio.gather(*self._pending_writes, return_exceptions=True)
         await self._redis.close()
 
     def _make_key(self, namespace: str, key: str) -> str:
-        """Create a namespaced cache key."""
-        return f"mizan:{namespace}:{key}"
+        """
+        Create a namespaced cache key (namespace prefixes are memoized).
+
+        The namespace is wrapped in Redis hash-tag braces so that, under
+        Redis Cluster, every key of a namespace hashes to the same slot —
+        SCAN/UNLINK in clear_namespace then touch a single shard instead
+        of fanning out to every node. On standalone Redis the braces are
+        just part of the key; existing entries under the old format
+        simply age out via TTL.
+        """
+        prefix = self._ns_prefixes.get(namespace)
+        if prefix is None:
+            prefix = self._ns_prefixes.setdefault(namespace, f"mizan:{{{namespace}}}:")
+        return prefix + key
 
     async def get(self, namespace: str, key: str) -> Any | None:
         """
@@ -64,7 +109,7 @@ class RedisCache:
         if value is None:
             return None
         try:
-            return json.loads(value)
+            return _json_loads(value)
         except json.JSONDecodeError:
             return value
 
@@ -74,6 +119,8 @@ class RedisCache:
         key: str,
         value: Any,
         ttl: int | None = None,
+        *,
+        fire_and_forget: bool = False,
     ) -> None:
         """
         Set a cached value.
@@ -83,15 +130,129 @@ class RedisCache:
             key: Cache key
             value: Value to cache (must be JSON serializable)
             ttl: Time-to-live in seconds (default: from settings)
+            fire_and_forget: When True, do not await the Redis round-trip.
+                For recomputable results (analysis caching) a lost write
+                only costs a future cache miss, so the caller saves one
+                RTT of latency. Writes are drained on close().
         """
-        cache_key = self._make_key(namespace, key)
-        ttl = ttl or self._settings.cache_ttl
-
         if isinstance(value, (dict, list)):
-            value = json.dumps(value, ensure_ascii=False)
+            value = _json_dumps(value)
+        await self._store(self._make_key(namespace, key), value, ttl, fire_and_forget)
+
+    async def set_json(
+        self,
+        namespace: str,
+        key: str,
+        value: dict[str, Any] | list[Any],
+        ttl: int | None = None,
+        *,
+        fire_and_forget: bool = False,
+    ) -> None:
+        """
+        Cache a JSON value, serializing unconditionally.
+
+        Specialized entrypoint for callers that always pass a dict/list
+        (the common case) — no per-call type dispatch.
+        """
+        await self._store(
+            self._make_key(namespace, key), _json_dumps(value), ttl, fire_and_forget
+        )
+
+    async def set_str(
+        self,
+        namespace: str,
+        key: str,
+        value: str,
+        ttl: int | None = None,
+        *,
+        fire_and_forget: bool = False,
+    ) -> None:
+        """Cache a raw string value without serialization."""
+        await self._store(self._make_key(namespace, key), value, ttl, fire_and_forget)
 
+    async def _store(
+        self,
+        cache_key: str,
+        payload: Any,
+        ttl: int | None,
+        fire_and_forget: bool,
+    ) -> None:
+        """Common write path for the set* entrypoints."""
+        ttl = ttl or self._default_ttl
+        if fire_and_forget:
+            task = asyncio.create_task(self._background_set(cache_key, payload, ttl))
+            self._pending_writes.add(task)
+            task.add_done_callback(self._discard_write)
+            return
+        await self._redis.set(cache_key, payload, ex=ttl)
+
+    async def _background_set(self, cache_key: str, value: Any, ttl: int) -> None:
+        """Perform one fire-and-forget SET."""
         await self._redis.set(cache_key, value, ex=ttl)
 
+    def _discard_write(self, task: asyncio.Task[None]) -> None:
+        """Untrack a finished fire-and-forget write, swallowing its error."""
+        self._pending_writes.discard(task)
+        if not task.cancelled():
+            # Retrieve the exception (if any) so the loop never logs an
+            # unhandled-task warning; a failed cache write is just a miss.
+            task.exception()
+
+    async def mget(self, namespace: str, keys: list[str]) -> list[Any | None]:
+        """
+        Get many cached values in one round-trip.
+
+        One MGET replaces N individual GETs, so bulk lookups (e.g. verse
+        ranges) pay a single network round-trip instead of one per key.
+
+        Args:
+            namespace: Cache namespace
+            keys: Cache keys
+
+        Returns:
+            Values aligned with the input keys; None for misses
+        """
+        cache_keys = [self._make_key(namespace, key) for key in keys]
+        values = await self._redis.mget(cache_keys)
+        results: list[Any | None] = []
+        for value in values:
+            if value is None:
+                results.append(None)
+                continue
+            try:
+                results.append(_json_loads(value))
+            except json.JSONDecodeError:
+                results.append(value)
+        return results
+
+    async def mset(
+        self,
+        namespace: str,
+        items: dict[str, Any],
+        ttl: int | None = None,
+    ) -> None:
+        """
+        Set many cached values in one round-trip.
+
+        All SETs are batched into a single non-transactional pipeline, so
+        N writes cost one network round-trip.
+
+        Args:
+            namespace: Cache namespace
+            items: Mapping of cache key to value
+            ttl: Time-to-live in seconds (default: from settings)
+        """
+        if not items:
+            return
+        ttl = ttl or self._default_ttl
+
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for key, value in items.items():
+                if isinstance(value, (dict, list)):
+                    value = _json_dumps(value)
+                pipe.set(self._make_key(namespace, key), value, ex=ttl)
+            await pipe.execute()
+
     async def delete(self, namespace: str, key: str) -> bool:
         """
         Delete a cached value.
@@ -111,13 +272,20 @@ class RedisCache:
             Number of keys deleted
         """
         pattern = self._make_key(namespace, "*")
-        keys: list[str] = []
-        async for key in self._redis.scan_iter(match=pattern):
-            keys.append(key)
-
-        if keys:
-            return int(await self._redis.delete(*keys))
-        return 0
+        deleted = 0
+        batch: list[str] = []
+        # Stream-delete in bounded batches: UNLINK frees memory on a Redis
+        # background thread (DEL frees synchronously on the main thread),
+        # and chunking avoids buffering every key client-side before one
+        # giant delete command.
+        async for key in self._redis.scan_iter(match=pattern, count=_SCAN_BATCH_SIZE):
+            batch.append(key)
+            if len(batch) >= _SCAN_BATCH_SIZE:
+                deleted += int(await self._redis.unlink(*batch))
+                batch.clear()
+        if batch:
+            deleted += int(await self._redis.unlink(*batch))
+        return deleted
 
     async def exists(self, namespace: str, key: str) -> bool:
         """Check if a key exists in cache."""
@@ -143,11 +311,26 @@ class RedisCache:
         Returns:
             Cached or computed value
         """
-        value = await self.get(namespace, key)
-        if value is not None:
-            return value
+        cache_key = self._make_key(namespace, key)
+
+        # One scripted round-trip: hit returns the value, miss atomically
+        # claims the slot so concurrent callers across processes do not
+        # all invoke the factory for the same key.
+        for _ in range(_CLAIM_POLL_ATTEMPTS):
+            raw = await self._get_or_claim(
+                keys=[cache_key], args=[_CLAIM_TTL_SECONDS, _PENDING_SENTINEL]
+            )
+            if raw == "":
+                break  # we claimed the slot — compute below
+            if raw is not None and raw != _PENDING_SENTINEL:
+                try:
+                    return _json_loads(raw)
+                except json.JSONDecodeError:
+                    return raw
+            # Another worker is computing — wait for its write
+            await asyncio.sleep(_CLAIM_POLL_INTERVAL)
+        # Fall through on claim or poll timeout (stale claim): compute.
 
-        # Compute value
         computed = factory() if callable(factory) else factory
         if isinstance(computed, Awaitable):
             value = await computed
@@ -165,10 +348,24 @@ class RedisCache:
         verse: int,
         analysis_type: str,
         result: dict[str, Any],
+        *,
+        fire_and_forget: bool = False,
     ) -> None:
         """Cache analysis result for a verse."""
         key = f"{surah}:{verse}:{analysis_type}"
-        await self.set("analysis", key, result)
+        await self.set_json("analysis", key, result, fire_and_forget=fire_and_forget)
+
+    async def cache_verse_analyses(
+        self,
+        analysis_type: str,
+        results: dict[tuple[int, int], dict[str, Any]],
+    ) -> None:
+        """Cache analysis results for many verses in one round-trip."""
+        items = {
+            f"{surah}:{verse}:{analysis_type}": result
+            for (surah, verse), result in results.items()
+        }
+        await self.mset("analysis", items)
 
     async def get_verse_analysis(
         self,
@@ -186,7 +383,7 @@ class RedisCache:
         results: list[dict[str, Any]],
     ) -> None:
         """Cache search results."""
-        await self.set("search", query_hash, results)
+        await self.set_json("search", query_hash, results)
 
     async def get_search_results(
         self,
@@ -207,21 +404,53 @@ class RedisCache:
             return False
 
 
+# Shared connection pool: every RedisCache created before the singleton
+# settles (test fixtures, background tasks) previously built its own
+# pool; one process-wide pool keeps socket count bounded.
+_pool: redis.ConnectionPool | None = None
+
+
+def _get_pool() -> redis.ConnectionPool:
+    """Get or create the process-wide Redis connection pool."""
+    global _pool
+    if _pool is None:
+        settings = get_settings()
+        _pool = redis.ConnectionPool.from_url(
+            settings.redis_url,
+            encoding="utf-8",
+            decode_responses=True,
+            max_connections=settings.redis_pool_size,
+            # Keep idle pool sockets alive and let the client surface dead
+            # peers proactively instead of on first failed command.
+            socket_keepalive=True,
+            health_check_interval=30,
+        )
+    return _pool
+
+
 # Global cache instance
 _cache: RedisCache | None = None
+_cache_lock = asyncio.Lock()
 
 
 async def get_cache() -> RedisCache:
     """Get or create the global cache instance."""
     global _cache
     if _cache is None:
-        _cache = await RedisCache.create()
+        # Double-checked under the lock so concurrent first callers
+        # cannot race two instances into existence.
+        async with _cache_lock:
+            if _cache is None:
+                _cache = await RedisCache.create()
     return _cache
 
 
 async def close_cache() -> None:
-    """Close the global cache instance."""
-    global _cache
+    """Close the global cache instance and release the shared pool."""
+    global _cache, _pool
     if _cache is not None:
         await _cache.close()
         _cache = None
+    if _pool is not None:
+        await _pool.disconnect()
+        _pool = None
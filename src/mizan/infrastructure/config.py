@@ -35,6 +35,14 @@ class Settings(BaseSettings):
     db_pool_size: int = Field(default=10, ge=1, le=100)
     db_max_overflow: int = Field(default=20, ge=0, le=100)
     db_echo: bool = Field(default=False, description="Echo SQL queries")
+    db_use_null_pool: bool = Field(
+        default=False,
+        description=(
+            "Disable client-side connection pooling (NullPool). Set True when "
+            "running behind PgBouncer, where server-side multiplexing makes a "
+            "client pool and its pre-ping SELECT 1 per checkout redundant."
+        ),
+    )
 
     # ==========================================================================
     # Redis Configuration
@@ -43,7 +51,9 @@ class Settings(BaseSettings):
         default="redis://localhost:6379/0",
         description="Redis connection URL",
     )
-    redis_pool_size: int = Field(default=10, ge=1, le=100)
+    # A small pool suffices for this GET/SET-dominated workload; bulk
+    # paths pipeline on one connection, so extra sockets are pure churn.
+    redis_pool_size: int = Field(default=4, ge=1, le=100)
     cache_ttl: int = Field(default=3600, ge=0, description="Cache TTL in seconds")
 
     # ==========================================================================
@@ -4,7 +4,8 @@ Integrity Guard - Fail-fast data integrity verification.
 Ensures Quranic text has not been corrupted or modified.
 """
 
-from datetime import datetime
+from collections.abc import Iterable, Sequence
+from datetime import UTC, datetime
 from typing import Final
 
 import structlog
@@ -104,6 +105,67 @@ class IntegrityGuard:
             context=f"Verse {location}",
         )
 
+    def verify_verses_bulk(
+        self,
+        items: Sequence[tuple[str, TextChecksum, VerseLocation]],
+    ) -> list[VerseLocation]:
+        """
+        Verify many verses in one pass.
+
+        Hashing runs straight through hashlib's direct constructors
+        (OpenSSL's SHA hardware extensions when the platform has them);
+        unlike looping verify_verse, nothing is logged per verse — only
+        the failures are reported, once, at the end.
+
+        Args:
+            items: (text, expected checksum, location) triples
+
+        Returns:
+            Locations that failed verification (empty if all passed)
+
+        Raises:
+            IntegrityViolationError: If any verse fails and fail_fast is True
+        """
+        failed: list[VerseLocation] = []
+        first_failure: tuple[str, TextChecksum, VerseLocation] | None = None
+        if not items:
+            return failed
+
+        algorithm = items[0][1].algorithm
+        if all(item[1].algorithm == algorithm for item in items):
+            # Uniform algorithm (the normal case): resolve the hasher
+            # constructor once and hash every text in one C-dominated
+            # batch instead of dispatching per verse.
+            actuals = TextChecksum.compute_many([item[0] for item in items], algorithm)
+            for item, actual in zip(items, actuals, strict=True):
+                if not item[1].matches(actual):
+                    failed.append(item[2])
+                    if first_failure is None:
+                        first_failure = item
+        else:
+            for item in items:
+                text, checksum, location = item
+                if not checksum.verify(text):
+                    failed.append(location)
+                    if first_failure is None:
+                        first_failure = item
+
+        if first_failure is not None:
+            logger.critical(
+                f"INTEGRITY VIOLATION: {len(failed)} of {len(items)} verses "
+                f"failed bulk verification. "
+                f"Failed locations: {', '.join(str(loc) for loc in failed[:10])}"
+            )
+            if self._fail_fast:
+                text, checksum, location = first_failure
+                raise IntegrityViolationError(
+                    expected=checksum,
+                    actual=TextChecksum.compute(text, checksum.algorithm),
+                    context=f"Verse {location}",
+                )
+
+        return failed
+
     def verify_surah(
         self,
         full_text: str,
@@ -155,6 +217,54 @@ class IntegrityGuard:
             context="Complete Quran",
         )
 
+    def verify_full_quran_streamed(
+        self,
+        chunks: Iterable[str],
+        separator: str = "\n",
+    ) -> bool:
+        """
+        Verify the complete Quran from text chunks without joining them.
+
+        Equivalent to ``verify_full_quran(separator.join(chunks))`` but
+        feeds one hasher incrementally, so a corpus-wide check never
+        materializes the whole Quran as a second in-memory string.
+
+        Args:
+            chunks: Text chunks (e.g. verses) in Mushaf order
+            separator: Separator between chunks (default: newline)
+
+        Returns:
+            True if valid
+
+        Raises:
+            IntegrityViolationError: If verification fails and fail_fast is True
+        """
+        if not self._expected_checksum:
+            logger.warning(
+                "No expected Quran checksum configured. Skipping full Quran verification."
+            )
+            return True
+
+        expected = TextChecksum(algorithm="sha256", value=self._expected_checksum)
+        actual = TextChecksum.compute_bulk(chunks, expected.algorithm, separator)
+
+        if not expected.matches(actual):
+            logger.critical(
+                "INTEGRITY VIOLATION: Checksum mismatch. "
+                f"Expected: {expected.value[:16]}..., "
+                f"Actual: {actual.value[:16]}... "
+                "Context: Complete Quran (streamed)"
+            )
+            if self._fail_fast:
+                raise IntegrityViolationError(
+                    expected=expected,
+                    actual=actual,
+                    context="Complete Quran (streamed)",
+                )
+            return False
+
+        return True
+
     def create_integrity_report(
         self,
         total_verses: int,
@@ -168,8 +278,8 @@ class IntegrityGuard:
         Args:
             total_verses: Total verses checked
             failed_locations: Locations of failed verifications
-            expected_checksum: Expected overall checksum
-            actual_checksum: Actual computed checksum
+            expected_checksum: Expected overall checksum (hex)
+            actual_checksum: Actual computed checksum (hex)
 
         Returns:
             IntegrityReport with details
@@ -189,11 +299,11 @@ class IntegrityGuard:
 
         return IntegrityReport(
             is_valid=is_valid,
-            checked_at=datetime.utcnow(),
+            checked_at=datetime.now(UTC),
             total_verses=total_verses,
             failed_verses=tuple(failed_locations),
-            expected_checksum=expected_checksum,
-            actual_checksum=actual_checksum,
+            expected_checksum=bytes.fromhex(expected_checksum),
+            actual_checksum=bytes.fromhex(actual_checksum),
             details=details,
         )
 
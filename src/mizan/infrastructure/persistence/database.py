@@ -14,6 +14,7 @@ from sqlalchemy.ext.asyncio import (
     create_async_engine,
 )
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import NullPool
 
 from mizan.infrastructure.config import get_settings
 
@@ -34,16 +35,33 @@ def get_engine() -> AsyncEngine:
     global _engine
     if _engine is None:
         settings = get_settings()
-        _engine = create_async_engine(
-            settings.database_url,
-            pool_size=settings.db_pool_size,
-            max_overflow=settings.db_max_overflow,
-            echo=settings.db_echo,
-            pool_pre_ping=True,  # Verify connections before use
-            pool_recycle=300,  # Recycle connections every 5 minutes
-            # Disable prepared statement cache for pgbouncer/Supabase pooler compatibility
-            connect_args={"statement_cache_size": 0, "prepared_statement_cache_size": 0},
-        )
+        # Disable prepared statement cache for pgbouncer/Supabase pooler compatibility
+        connect_args = {"statement_cache_size": 0, "prepared_statement_cache_size": 0}
+        # Compiled-SQL cache sized for the full set of repository query
+        # shapes (default 500 can evict under mixed workloads).
+        query_cache_size = 1200
+        if settings.db_use_null_pool:
+            # Behind PgBouncer the server multiplexes connections, so a
+            # client-side pool just double-pools and pool_pre_ping wastes
+            # one SELECT 1 round-trip per checkout.
+            _engine = create_async_engine(
+                settings.database_url,
+                poolclass=NullPool,
+                echo=settings.db_echo,
+                query_cache_size=query_cache_size,
+                connect_args=connect_args,
+            )
+        else:
+            _engine = create_async_engine(
+                settings.database_url,
+                pool_size=settings.db_pool_size,
+                max_overflow=settings.db_max_overflow,
+                echo=settings.db_echo,
+                query_cache_size=query_cache_size,
+                pool_pre_ping=True,  # Verify connections before use (direct connections only)
+                pool_recycle=300,  # Recycle connections every 5 minutes
+                connect_args=connect_args,
+            )
     return _engine
 
 
@@ -73,12 +91,30 @@ async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
     async with factory() as session:
         try:
             yield session
-            await session.commit()
+            # Commit only if the session actually began a transaction —
+            # a handler that executed nothing should not pay a COMMIT
+            # round-trip.
+            if session.in_transaction():
+                await session.commit()
         except Exception:
             await session.rollback()
             raise
 
 
+async def get_readonly_session() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency for read-only endpoints.
+
+    Skips the COMMIT that get_async_session issues after every request:
+    pure reads have nothing to persist, and releasing the connection back
+    to the pool resets its transaction anyway, so the commit is one
+    wasted PostgreSQL round-trip per request.
+    """
+    factory = async_session_factory()
+    async with factory() as session:
+        yield session
+
+
 @asynccontextmanager
 async def get_session_context() -> AsyncGenerator[AsyncSession, None]:
     """
@@ -92,7 +128,8 @@ async def get_session_context() -> AsyncGenerator[AsyncSession, None]:
     async with factory() as session:
         try:
             yield session
-            await session.commit()
+            if session.in_transaction():
+                await session.commit()
         except Exception:
             await session.rollback()
             raise
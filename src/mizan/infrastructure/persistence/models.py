@@ -19,6 +19,7 @@ from sqlalchemy import (
     String,
     Text,
     UniqueConstraint,
+    func,
 )
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
@@ -83,9 +84,14 @@ class SurahModel(Base):
     checksum: Mapped[str] = mapped_column(String(128), nullable=False)
 
     # Timestamps
-    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, server_default=func.timezone("utc", func.now())
+    )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow
+        DateTime,
+        nullable=False,
+        server_default=func.timezone("utc", func.now()),
+        onupdate=func.timezone("utc", func.now()),
     )
 
     # Relationships — lazy="raise" prevents accidental N+1 queries.
@@ -156,12 +162,23 @@ class VerseModel(Base):
     checksum: Mapped[str] = mapped_column(String(128), nullable=False)
 
     # Timestamps
-    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, server_default=func.timezone("utc", func.now())
+    )
 
     # Relationships
-    surah: Mapped["SurahModel"] = relationship("SurahModel", back_populates="verses")
+    # lazy="raise" — every read path joins surahs anyway and populates
+    # this from the same row with contains_eager, so a lazy load here
+    # would always be an accidental N+1.
+    surah: Mapped["SurahModel"] = relationship(
+        "SurahModel", back_populates="verses", lazy="raise"
+    )
+    # lazy="raise" — no current reader walks this relationship (the
+    # morphology repository queries MorphologyModel directly), and the old
+    # mapper-level selectin emitted an extra SELECT per verse load. Use
+    # explicit options(selectinload(...)) in queries that need it.
     morphology: Mapped[list["MorphologyModel"]] = relationship(
-        "MorphologyModel", back_populates="verse", lazy="selectin"
+        "MorphologyModel", back_populates="verse", lazy="raise"
     )
 
     # Indexes for common queries
@@ -222,6 +239,11 @@ class MorphologyModel(Base):
     lemma: Mapped[str | None] = mapped_column(String(50), nullable=True)
     pattern: Mapped[str | None] = mapped_column(String(30), nullable=True)
 
+    # Canonical search forms (no dashes, no tatweel U+0640), pre-computed at
+    # ingest time so lookups hit the index instead of normalizing per query.
+    root_normalized: Mapped[str | None] = mapped_column(String(20), nullable=True)
+    lemma_normalized: Mapped[str | None] = mapped_column(String(50), nullable=True)
+
     # Grammatical features
     person: Mapped[str | None] = mapped_column(String(5), nullable=True)
     gender: Mapped[str | None] = mapped_column(String(5), nullable=True)
@@ -241,6 +263,19 @@ class MorphologyModel(Base):
         Index("ix_morphology_location", "surah_number", "verse_number", "word_number"),
         Index("ix_morphology_root", "root"),
         Index("ix_morphology_lemma", "lemma"),
+        # Covering indexes: root/lemma searches select only the three
+        # location columns, so INCLUDE-ing them makes the lookups
+        # index-only scans (no heap visits).
+        Index(
+            "ix_morphology_root_norm",
+            "root_normalized",
+            postgresql_include=["surah_number", "verse_number", "word_number"],
+        ),
+        Index(
+            "ix_morphology_lemma_norm",
+            "lemma_normalized",
+            postgresql_include=["surah_number", "verse_number", "word_number"],
+        ),
         Index("ix_morphology_pos", "pos_tag"),
         Index("ix_morphology_verse_id", "verse_id"),
     )
@@ -267,7 +302,9 @@ class LibrarySpaceModel(Base):
     id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), primary_key=True, default=uuid4)
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, server_default=func.timezone("utc", func.now())
+    )
 
     # Relationships
     sources: Mapped[list["TextSourceModel"]] = relationship(
@@ -305,9 +342,14 @@ class TextSourceModel(Base):
     total_chunks: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     indexed_chunks: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     embedding_model: Mapped[str | None] = mapped_column(String(200), nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, server_default=func.timezone("utc", func.now())
+    )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow
+        DateTime,
+        nullable=False,
+        server_default=func.timezone("utc", func.now()),
+        onupdate=func.timezone("utc", func.now()),
     )
 
     # Relationships
@@ -352,7 +394,9 @@ class TextChunkModel(Base):
     metadata_: Mapped[dict[str, object]] = mapped_column(
         "metadata", JSONB, nullable=False, default=dict
     )
-    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, server_default=func.timezone("utc", func.now())
+    )
 
     # Relationships
     source: Mapped["TextSourceModel"] = relationship("TextSourceModel", back_populates="chunks")
@@ -390,7 +434,9 @@ class VerseTranslationModel(Base):
     resource_id: Mapped[int] = mapped_column(Integer, nullable=False)
     embedding: Mapped[list[float] | None] = mapped_column(Vector(768), nullable=True)
     model_name: Mapped[str | None] = mapped_column(String(200), nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, server_default=func.timezone("utc", func.now())
+    )
 
     # Relationships
     verse: Mapped["VerseModel"] = relationship("VerseModel")
@@ -425,7 +471,9 @@ class VerseEmbeddingModel(Base):
     verse_number: Mapped[int] = mapped_column(Integer, nullable=False)
     embedding: Mapped[list[float]] = mapped_column(Vector(768), nullable=False)
     model_name: Mapped[str] = mapped_column(String(200), nullable=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, server_default=func.timezone("utc", func.now())
+    )
 
     # Relationships
     verse: Mapped["VerseModel"] = relationship("VerseModel")
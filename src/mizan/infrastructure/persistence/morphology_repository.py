@@ -4,20 +4,59 @@ PostgreSQL implementation of IMorphologyRepository.
 
 from __future__ import annotations
 
-from sqlalchemy import func, select
+from array import array
+from collections.abc import Mapping, Sequence
+from typing import ClassVar
+
+from sqlalchemy import func, select, text, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from mizan.domain.repositories import IMorphologyRepository, MorphologyData
+from mizan.domain.repositories import (
+    IMorphologyRepository,
+    MorphologyColumns,
+    MorphologyData,
+)
 from mizan.domain.value_objects import VerseLocation
 from mizan.infrastructure.persistence.models import MorphologyModel
 
 
+def _normalize(term: str) -> str:
+    """Canonical search form: no dashes, no tatweel (U+0640).
+
+    Matches the pre-computed root_normalized/lemma_normalized columns, so
+    queries are plain indexed equality with no per-row string surgery.
+    """
+    return term.replace("-", "").replace("ـ", "")
+
+
 class PostgresMorphologyRepository(IMorphologyRepository):
     """PostgreSQL implementation of IMorphologyRepository."""
 
+    # Corpus-wide aggregates are identical for every request until the MASAQ
+    # data is re-ingested, so they are cached at class level (repositories
+    # are per-request) and invalidated by a cheap (count, max id) version
+    # probe instead of a full rescan.
+    _roots_cache_version: ClassVar[tuple[int, int] | None] = None
+    _root_freq_cache: ClassVar[dict[str, int] | None] = None
+    _unique_roots_cache: ClassVar[frozenset[str] | None] = None
+
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
 
+    async def _data_version(self) -> tuple[int, int]:
+        """Cheap cache-invalidation key for the morphology table."""
+        stmt = select(func.count(MorphologyModel.id), func.max(MorphologyModel.id))
+        result = await self._session.execute(stmt)
+        count, max_id = result.one()
+        return int(count or 0), int(max_id or 0)
+
+    @classmethod
+    def clear_roots_cache(cls) -> None:
+        """Drop the cached corpus aggregates (mainly for tests/ingestion)."""
+        cls._roots_cache_version = None
+        cls._root_freq_cache = None
+        cls._unique_roots_cache = None
+
     def _model_to_data(self, model: MorphologyModel) -> MorphologyData:
         return MorphologyData(
             word_uthmani=model.word_uthmani,
@@ -76,16 +115,61 @@ class PostgresMorphologyRepository(IMorphologyRepository):
             words[word_num].append(self._model_to_data(model))
         return [words[k] for k in sorted(words.keys())]
 
-    async def search_by_root(self, root: str) -> list[tuple[VerseLocation, int]]:
-        normalized_root = root.replace("-", "").replace("ـ", "")
+    async def get_morphology_batch(
+        self,
+        locations: Sequence[tuple[VerseLocation, int]],
+    ) -> dict[tuple[VerseLocation, int], list[MorphologyData]]:
+        results: dict[tuple[VerseLocation, int], list[MorphologyData]] = {
+            key: [] for key in locations
+        }
+        if not results:
+            return results
+
+        triples = {
+            (loc.surah_number, loc.verse_number, word) for loc, word in results
+        }
+        stmt = (
+            select(MorphologyModel)
+            .where(
+                tuple_(
+                    MorphologyModel.surah_number,
+                    MorphologyModel.verse_number,
+                    MorphologyModel.word_number,
+                ).in_(triples)
+            )
+            .order_by(
+                MorphologyModel.surah_number,
+                MorphologyModel.verse_number,
+                MorphologyModel.word_number,
+                MorphologyModel.segment_number,
+            )
+        )
+        result = await self._session.execute(stmt)
+        for model in result.scalars().all():
+            key = (
+                VerseLocation(model.surah_number, model.verse_number),
+                model.word_number,
+            )
+            if key in results:
+                results[key].append(self._model_to_data(model))
+        return results
+
+    async def search_by_root_packed(self, root: str) -> array[int]:
         stmt = (
             select(
                 MorphologyModel.surah_number,
                 MorphologyModel.verse_number,
                 MorphologyModel.word_number,
             )
-            .where(MorphologyModel.root == normalized_root)
-            .distinct()
+            .where(MorphologyModel.root_normalized == _normalize(root))
+            # GROUP BY over the projected columns dedupes same-root word
+            # segments via the covering index's sorted output, instead of
+            # DISTINCT's hash-aggregate over the result set.
+            .group_by(
+                MorphologyModel.surah_number,
+                MorphologyModel.verse_number,
+                MorphologyModel.word_number,
+            )
             .order_by(
                 MorphologyModel.surah_number,
                 MorphologyModel.verse_number,
@@ -93,17 +177,46 @@ class PostgresMorphologyRepository(IMorphologyRepository):
             )
         )
         result = await self._session.execute(stmt)
-        return [(VerseLocation(row[0], row[1]), row[2]) for row in result.all()]
+        # Pack straight from the row ints — no VerseLocation per match.
+        return array(
+            "I",
+            ((surah << 20) | (verse << 8) | word for surah, verse, word in result.all()),
+        )
+
+    async def search_by_root(self, root: str) -> list[tuple[VerseLocation, int]]:
+        return [
+            VerseLocation.unpack_word(packed)
+            for packed in await self.search_by_root_packed(root)
+        ]
+
+    async def search_by_roots(
+        self,
+        roots: Sequence[str],
+    ) -> dict[str, list[tuple[VerseLocation, int]]]:
+        results: dict[str, list[tuple[VerseLocation, int]]] = {root: [] for root in roots}
+        if not results:
+            return results
+
+        # Several spellings (e.g. ك-ت-ب and كتب) may normalize to the same
+        # stored root; remember which requested keys each one serves.
+        normalized: dict[str, list[str]] = {}
+        for root in results:
+            normalized.setdefault(_normalize(root), []).append(root)
 
-    async def search_by_lemma(self, lemma: str) -> list[tuple[VerseLocation, int]]:
         stmt = (
             select(
+                MorphologyModel.root_normalized,
+                MorphologyModel.surah_number,
+                MorphologyModel.verse_number,
+                MorphologyModel.word_number,
+            )
+            .where(MorphologyModel.root_normalized.in_(normalized))
+            .group_by(
+                MorphologyModel.root_normalized,
                 MorphologyModel.surah_number,
                 MorphologyModel.verse_number,
                 MorphologyModel.word_number,
             )
-            .where(MorphologyModel.lemma == lemma)
-            .distinct()
             .order_by(
                 MorphologyModel.surah_number,
                 MorphologyModel.verse_number,
@@ -111,22 +224,120 @@ class PostgresMorphologyRepository(IMorphologyRepository):
             )
         )
         result = await self._session.execute(stmt)
-        return [(VerseLocation(row[0], row[1]), row[2]) for row in result.all()]
+        for root, surah, verse, word in result.all():
+            occurrence = (VerseLocation(surah, verse), word)
+            for requested in normalized[root]:
+                results[requested].append(occurrence)
+        return results
 
-    async def get_root_frequency(self) -> dict[str, int]:
+    async def search_by_lemma(self, lemma: str) -> list[tuple[VerseLocation, int]]:
         stmt = (
             select(
-                MorphologyModel.root,
-                func.count(MorphologyModel.id).label("count"),
+                MorphologyModel.surah_number,
+                MorphologyModel.verse_number,
+                MorphologyModel.word_number,
+            )
+            .where(MorphologyModel.lemma_normalized == _normalize(lemma))
+            .group_by(
+                MorphologyModel.surah_number,
+                MorphologyModel.verse_number,
+                MorphologyModel.word_number,
+            )
+            .order_by(
+                MorphologyModel.surah_number,
+                MorphologyModel.verse_number,
+                MorphologyModel.word_number,
             )
-            .where(MorphologyModel.root.isnot(None))
-            .group_by(MorphologyModel.root)
-            .order_by(func.count(MorphologyModel.id).desc())
         )
         result = await self._session.execute(stmt)
-        return {row[0]: row[1] for row in result.all() if row[0]}
+        return [(VerseLocation(row[0], row[1]), row[2]) for row in result.all()]
 
-    async def get_unique_roots(self) -> set[str]:
-        stmt = select(MorphologyModel.root).where(MorphologyModel.root.isnot(None)).distinct()
+    async def load_columns(self) -> MorphologyColumns:
+        stmt = select(
+            MorphologyModel.surah_number,
+            MorphologyModel.verse_number,
+            MorphologyModel.word_number,
+            MorphologyModel.root,
+            MorphologyModel.lemma,
+            MorphologyModel.pos_tag,
+            MorphologyModel.morpheme_type,
+        ).order_by(
+            MorphologyModel.surah_number,
+            MorphologyModel.verse_number,
+            MorphologyModel.word_number,
+            MorphologyModel.segment_number,
+        )
         result = await self._session.execute(stmt)
-        return {row[0] for row in result.all() if row[0]}
+
+        # Dictionary-encode each string field: code 0 is reserved for None
+        # in the nullable columns.
+        root_codes: dict[str | None, int] = {None: 0}
+        lemma_codes: dict[str | None, int] = {None: 0}
+        pos_codes: dict[str, int] = {}
+        morpheme_codes: dict[str, int] = {}
+
+        surahs: list[int] = []
+        verses: list[int] = []
+        words: list[int] = []
+        roots: list[int] = []
+        lemmas: list[int] = []
+        pos_tags: list[int] = []
+        morphemes: list[int] = []
+
+        for surah, verse, word, root, lemma, pos_tag, morpheme_type in result.all():
+            surahs.append(surah)
+            verses.append(verse)
+            words.append(word)
+            roots.append(root_codes.setdefault(root, len(root_codes)))
+            lemmas.append(lemma_codes.setdefault(lemma, len(lemma_codes)))
+            pos_tags.append(pos_codes.setdefault(pos_tag, len(pos_codes)))
+            morphemes.append(morpheme_codes.setdefault(morpheme_type, len(morpheme_codes)))
+
+        return MorphologyColumns(
+            surah_numbers=tuple(surahs),
+            verse_numbers=tuple(verses),
+            word_numbers=tuple(words),
+            roots=tuple(roots),
+            lemmas=tuple(lemmas),
+            pos_tags=tuple(pos_tags),
+            morpheme_types=tuple(morphemes),
+            root_labels=tuple(root_codes),
+            lemma_labels=tuple(lemma_codes),
+            pos_labels=tuple(pos_codes),
+            morpheme_type_labels=tuple(morpheme_codes),
+        )
+
+    async def get_root_frequency(self) -> Mapping[str, int]:
+        cls = type(self)
+        version = await self._data_version()
+        if cls._root_freq_cache is not None and cls._roots_cache_version == version:
+            return cls._root_freq_cache
+
+        # Pre-aggregated in mv_root_frequency (migration 0006); the view is
+        # refreshed by ingest_masaq.py, not per request, so this reads a few
+        # thousand rows instead of GROUP BY-ing the whole morphology table.
+        result = await self._session.execute(
+            text("SELECT root, freq FROM mv_root_frequency ORDER BY freq DESC")
+        )
+        frequency = {row[0]: row[1] for row in result.all() if row[0]}
+
+        if cls._roots_cache_version != version:
+            cls._unique_roots_cache = None
+        cls._roots_cache_version = version
+        cls._root_freq_cache = frequency
+        return frequency
+
+    async def get_unique_roots(self) -> frozenset[str]:
+        cls = type(self)
+        version = await self._data_version()
+        if cls._unique_roots_cache is not None and cls._roots_cache_version == version:
+            return cls._unique_roots_cache
+
+        result = await self._session.execute(text("SELECT root FROM mv_root_frequency"))
+        roots = frozenset(row[0] for row in result.all() if row[0])
+
+        if cls._roots_cache_version != version:
+            cls._root_freq_cache = None
+        cls._roots_cache_version = version
+        cls._unique_roots_cache = roots
+        return roots
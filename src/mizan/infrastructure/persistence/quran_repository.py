@@ -4,14 +4,17 @@ PostgreSQL implementation of IQuranRepository.
 
 from __future__ import annotations
 
-from collections.abc import AsyncIterator
-from datetime import datetime
+import hashlib
+from collections.abc import AsyncIterator, Sequence
+from typing import Any
 
 import structlog
-from sqlalchemy import func, select
+from sqlalchemy import Select, func, lambda_stmt, literal, select, text, tuple_
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import contains_eager
 
-from mizan.domain.entities import Surah, Verse
+from mizan.domain.entities import Surah, Verse, VersePreview
 from mizan.domain.enums import (
     BasmalahStatus,
     QiraatType,
@@ -27,12 +30,27 @@ from mizan.domain.exceptions import (
 from mizan.domain.repositories import (
     IntegrityReport,
     IQuranRepository,
+    SlimIntegrityReport,
 )
 from mizan.domain.value_objects import SurahMetadata, TextChecksum, VerseLocation
 from mizan.infrastructure.persistence.models import SurahModel, VerseModel
 
 logger = structlog.get_logger(__name__)
 
+# Rows fetched per round trip on streaming reads (server-side cursor batch).
+_STREAM_BATCH_SIZE = 200
+
+# Multi-word queries at least this long are matched via the tsvector GIN
+# index instead of the trigram index.
+_MIN_TSQUERY_LENGTH = 6
+
+# Shared default for the common no-variants case. Verse is frozen and only
+# ever reads this mapping — never mutate it.
+_EMPTY_QIRAAT: dict[QiraatType, dict[ScriptType, str]] = {}
+
+# Cap on composite-IN list size for batched lookups (plan-size guard).
+_IN_LIST_BATCH_SIZE = 500
+
 
 class PostgresQuranRepository(IQuranRepository):
     """
@@ -44,34 +62,57 @@ class PostgresQuranRepository(IQuranRepository):
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
 
-    def _model_to_verse(self, model: VerseModel, surah_model: SurahModel) -> Verse:
-        """Convert database model to domain entity."""
-        content: dict[ScriptType, str] = {ScriptType.UTHMANI: model.text_uthmani}
-        if model.text_uthmani_min:
-            content[ScriptType.UTHMANI_MINIMAL] = model.text_uthmani_min
-        if model.text_simple:
-            content[ScriptType.SIMPLE] = model.text_simple
-
-        surah_metadata = SurahMetadata(
+    @staticmethod
+    def _build_surah_metadata(surah_model: SurahModel) -> SurahMetadata:
+        """Convert a surah row to its immutable metadata value object."""
+        return SurahMetadata(
             number=surah_model.id,
             name_arabic=surah_model.name_arabic,
             name_english=surah_model.name_english,
             name_transliteration=surah_model.name_transliteration,
-            revelation_type=RevelationType(surah_model.revelation_type),
+            revelation_type=RevelationType.from_str(surah_model.revelation_type),
             revelation_order=surah_model.revelation_order,
             verse_count=surah_model.verse_count,
-            basmalah_status=BasmalahStatus(surah_model.basmalah_status),
+            basmalah_status=BasmalahStatus.from_str(surah_model.basmalah_status),
             ruku_count=surah_model.ruku_count,
             word_count=surah_model.word_count,
             letter_count=surah_model.letter_count,
         )
 
-        qiraat_variants: dict[QiraatType, dict[ScriptType, str]] = {}
+    def _model_to_verse(self, model: VerseModel) -> Verse:
+        """Convert database model to domain entity.
+
+        Expects ``model.surah`` to be populated from the same row via
+        ``contains_eager`` (the relationship is lazy="raise").
+        """
+        return self._model_to_verse_with_metadata(model, self._build_surah_metadata(model.surah))
+
+    def _model_to_verse_with_metadata(
+        self, model: VerseModel, surah_metadata: SurahMetadata
+    ) -> Verse:
+        """Convert a verse row reusing already-built surah metadata.
+
+        SurahMetadata is immutable, so bulk paths build it once per
+        distinct surah instead of once per verse (286 times for
+        Al-Baqarah via the naive path).
+        """
+        content: dict[ScriptType, str] = {ScriptType.UTHMANI: model.text_uthmani}
+        if model.text_uthmani_min:
+            content[ScriptType.UTHMANI_MINIMAL] = model.text_uthmani_min
+        if model.text_simple:
+            content[ScriptType.SIMPLE] = model.text_simple
+
+        # Almost every verse has NULL/empty qiraat_variants; hand those the
+        # shared empty dict instead of allocating one per row.
+        qiraat_variants: dict[QiraatType, dict[ScriptType, str]] = _EMPTY_QIRAAT
         if model.qiraat_variants:
+            qiraat_variants = {}
             for qiraat_key, scripts in model.qiraat_variants.items():
                 try:
-                    qiraat = QiraatType(qiraat_key)
-                    qiraat_variants[qiraat] = {ScriptType(k): v for k, v in scripts.items()}
+                    qiraat = QiraatType.from_str(qiraat_key)
+                    qiraat_variants[qiraat] = {
+                        ScriptType.from_str(k): v for k, v in scripts.items()
+                    }
                 except ValueError:
                     logger.warning(
                         "unknown_qiraat_variant",
@@ -82,15 +123,14 @@ class PostgresQuranRepository(IQuranRepository):
 
         return Verse(
             id=model.id,
-            location=VerseLocation(
-                surah_number=model.surah_number,
-                verse_number=model.verse_number,
-            ),
+            # Interned lookup: 6,236 valid locations, each validated once
+            # per process instead of once per row.
+            location=VerseLocation.get(model.surah_number, model.verse_number),
             content=content,
             qiraat_variants=qiraat_variants,
             surah_metadata=surah_metadata,
             is_sajdah=model.is_sajdah,
-            sajdah_type=SajdahType(model.sajdah_type) if model.sajdah_type else None,
+            sajdah_type=SajdahType.from_str(model.sajdah_type) if model.sajdah_type else None,
             juz_number=model.juz_number,
             hizb_number=model.hizb_number,
             ruku_number=model.ruku_number,
@@ -102,20 +142,43 @@ class PostgresQuranRepository(IQuranRepository):
             abjad_value_mashriqi=model.abjad_value_mashriqi,
         )
 
+    def _rows_to_verses(self, models: Sequence[VerseModel]) -> list[Verse]:
+        """Convert verse models, building metadata once per surah.
+
+        Each model's ``surah`` is populated from the joined row via
+        ``contains_eager``, so no extra query is emitted here.
+        """
+        metadata_cache: dict[int, SurahMetadata] = {}
+        verses: list[Verse] = []
+        for verse_model, surah_model in ((m, m.surah) for m in models):
+            metadata = metadata_cache.get(surah_model.id)
+            if metadata is None:
+                metadata = metadata_cache.setdefault(
+                    surah_model.id, self._build_surah_metadata(surah_model)
+                )
+            verses.append(self._model_to_verse_with_metadata(verse_model, metadata))
+        return verses
+
     async def get_verse(self, location: VerseLocation) -> Verse | None:
-        stmt = (
-            select(VerseModel, SurahModel)
-            .join(SurahModel, VerseModel.surah_number == SurahModel.id)
+        # lambda_stmt caches the built expression and its compilation
+        # cache key; only the two closure scalars vary per call, so the
+        # hottest single-verse lookup skips re-building the select tree.
+        surah_number = location.surah_number
+        verse_number = location.verse_number
+        stmt = lambda_stmt(
+            lambda: select(VerseModel)
+            .join(VerseModel.surah)
+            .options(contains_eager(VerseModel.surah))
             .where(
-                VerseModel.surah_number == location.surah_number,
-                VerseModel.verse_number == location.verse_number,
+                VerseModel.surah_number == surah_number,
+                VerseModel.verse_number == verse_number,
             )
         )
         result = await self._session.execute(stmt)
-        row = result.first()
-        if row is None:
+        model = result.scalars().first()
+        if model is None:
             return None
-        return self._model_to_verse(row[0], row[1])
+        return self._model_to_verse(model)
 
     async def get_verse_or_raise(self, location: VerseLocation) -> Verse:
         verse = await self.get_verse(location)
@@ -137,20 +200,9 @@ class PostgresQuranRepository(IQuranRepository):
         )
         verses_result = await self._session.execute(verses_stmt)
         verse_models = verses_result.scalars().all()
-        verses = tuple(self._model_to_verse(vm, surah_model) for vm in verse_models)
-
-        metadata = SurahMetadata(
-            number=surah_model.id,
-            name_arabic=surah_model.name_arabic,
-            name_english=surah_model.name_english,
-            name_transliteration=surah_model.name_transliteration,
-            revelation_type=RevelationType(surah_model.revelation_type),
-            revelation_order=surah_model.revelation_order,
-            verse_count=surah_model.verse_count,
-            basmalah_status=BasmalahStatus(surah_model.basmalah_status),
-            ruku_count=surah_model.ruku_count,
-            word_count=surah_model.word_count,
-            letter_count=surah_model.letter_count,
+        metadata = self._build_surah_metadata(surah_model)
+        verses = tuple(
+            self._model_to_verse_with_metadata(vm, metadata) for vm in verse_models
         )
         return Surah(
             metadata=metadata,
@@ -158,6 +210,36 @@ class PostgresQuranRepository(IQuranRepository):
             checksum=TextChecksum.from_string(surah_model.checksum),
         )
 
+    async def get_verses(
+        self,
+        locations: Sequence[VerseLocation],
+    ) -> dict[VerseLocation, Verse]:
+        if not locations:
+            return {}
+        pairs = sorted({(loc.surah_number, loc.verse_number) for loc in locations})
+        if len(pairs) > _IN_LIST_BATCH_SIZE:
+            # Very large IN lists bloat the plan; fetch in fixed-size
+            # batches (still one statement per 500 locations, not per row).
+            verses: dict[VerseLocation, Verse] = {}
+            for start in range(0, len(pairs), _IN_LIST_BATCH_SIZE):
+                batch = pairs[start : start + _IN_LIST_BATCH_SIZE]
+                verses.update(
+                    await self.get_verses(
+                        [VerseLocation.get(surah, verse) for surah, verse in batch]
+                    )
+                )
+            return verses
+        stmt = (
+            select(VerseModel)
+            .join(VerseModel.surah)
+            .options(contains_eager(VerseModel.surah))
+            .where(tuple_(VerseModel.surah_number, VerseModel.verse_number).in_(pairs))
+        )
+        result = await self._session.execute(stmt)
+        return {
+            verse.location: verse for verse in self._rows_to_verses(result.scalars().all())
+        }
+
     async def get_verses_in_range(
         self,
         start: VerseLocation,
@@ -167,52 +249,64 @@ class PostgresQuranRepository(IQuranRepository):
             raise VerseRangeError(start, end, "Start must be before or equal to end")
 
         stmt = (
-            select(VerseModel, SurahModel)
-            .join(SurahModel, VerseModel.surah_number == SurahModel.id)
+            select(VerseModel)
+            .join(VerseModel.surah)
+            .options(contains_eager(VerseModel.surah))
             .where(
-                (
-                    (VerseModel.surah_number > start.surah_number)
-                    | (
-                        (VerseModel.surah_number == start.surah_number)
-                        & (VerseModel.verse_number >= start.verse_number)
-                    )
-                )
-                & (
-                    (VerseModel.surah_number < end.surah_number)
-                    | (
-                        (VerseModel.surah_number == end.surah_number)
-                        & (VerseModel.verse_number <= end.verse_number)
-                    )
+                # Row-constructor comparison: the planner maps this directly
+                # onto a bounded range scan of ix_verses_surah_verse, where
+                # the equivalent OR-of-ANDs tree often got a seq scan.
+                tuple_(VerseModel.surah_number, VerseModel.verse_number).between(
+                    tuple_(literal(start.surah_number), literal(start.verse_number)),
+                    tuple_(literal(end.surah_number), literal(end.verse_number)),
                 )
             )
             .order_by(VerseModel.surah_number, VerseModel.verse_number)
         )
         result = await self._session.execute(stmt)
-        return [self._model_to_verse(row[0], row[1]) for row in result.all()]
+        return self._rows_to_verses(result.scalars().all())
 
     async def get_all_verses(self) -> list[Verse]:
-        stmt = (
-            select(VerseModel, SurahModel)
-            .join(SurahModel, VerseModel.surah_number == SurahModel.id)
+        stmt = lambda_stmt(
+            lambda: select(VerseModel)
+            .join(VerseModel.surah)
+            .options(contains_eager(VerseModel.surah))
             .order_by(VerseModel.surah_number, VerseModel.verse_number)
         )
         result = await self._session.execute(stmt)
-        return [self._model_to_verse(row[0], row[1]) for row in result.all()]
+        return self._rows_to_verses(result.scalars().all())
 
     async def stream_verses(
         self,
         surah_number: int | None = None,
     ) -> AsyncIterator[Verse]:
-        stmt = select(VerseModel, SurahModel).join(
-            SurahModel, VerseModel.surah_number == SurahModel.id
+        stmt = (
+            select(VerseModel)
+            .join(VerseModel.surah)
+            .options(contains_eager(VerseModel.surah))
         )
         if surah_number is not None:
             stmt = stmt.where(VerseModel.surah_number == surah_number)
         stmt = stmt.order_by(VerseModel.surah_number, VerseModel.verse_number)
 
-        result = await self._session.stream(stmt)
-        async for row in result:
-            yield self._model_to_verse(row[0], row[1])
+        metadata_cache: dict[int, SurahMetadata] = {}
+        # yield_per + stream_results opens a real server-side cursor and
+        # caps ORM identity-map buffering at one batch; without it the
+        # driver pulls the whole result set into memory before the first
+        # row is yielded. 200 rows per fetch balances round trips against
+        # resident row memory (~32 fetches for the full corpus).
+        result = await self._session.stream(
+            stmt.execution_options(yield_per=_STREAM_BATCH_SIZE, stream_results=True)
+        )
+        async for partition in result.scalars().partitions(_STREAM_BATCH_SIZE):
+            for model in partition:
+                surah_model = model.surah
+                metadata = metadata_cache.get(surah_model.id)
+                if metadata is None:
+                    metadata = metadata_cache.setdefault(
+                        surah_model.id, self._build_surah_metadata(surah_model)
+                    )
+                yield self._model_to_verse_with_metadata(model, metadata)
 
     async def get_verse_count(self, surah_number: int | None = None) -> int:
         stmt = select(func.count(VerseModel.id))
@@ -221,17 +315,42 @@ class PostgresQuranRepository(IQuranRepository):
         result = await self._session.execute(stmt)
         return int(result.scalar_one())
 
-    async def get_verses_by_criteria(
-        self,
-        revelation_type: RevelationType | None = None,
-        juz_number: int | None = None,
-        hizb_number: int | None = None,
-        manzil_number: int | None = None,
-        has_sajdah: bool | None = None,
-    ) -> list[Verse]:
-        stmt = select(VerseModel, SurahModel).join(
-            SurahModel, VerseModel.surah_number == SurahModel.id
-        )
+    # Columns a listing actually renders — ~5-10x narrower than a full
+    # (VerseModel, SurahModel) row with every script variant and JSONB.
+    _PREVIEW_COLUMNS = (
+        VerseModel.surah_number,
+        VerseModel.verse_number,
+        VerseModel.text_uthmani,
+        VerseModel.is_sajdah,
+        VerseModel.sajdah_type,
+        SurahModel.name_arabic,
+    )
+
+    @staticmethod
+    def _rows_to_previews(
+        rows: Sequence[tuple[int, int, str, bool, str | None, str]],
+    ) -> list[VersePreview]:
+        """Convert pruned column rows to preview read models."""
+        return [
+            VersePreview(
+                location=VerseLocation.get(surah, verse),
+                text_uthmani=text,
+                is_sajdah=is_sajdah,
+                sajdah_type=SajdahType.from_str(sajdah) if sajdah else None,
+                surah_name_arabic=name_arabic,
+            )
+            for surah, verse, text, is_sajdah, sajdah, name_arabic in rows
+        ]
+
+    @staticmethod
+    def _apply_criteria(
+        stmt: Select[Any],
+        revelation_type: RevelationType | None,
+        juz_number: int | None,
+        hizb_number: int | None,
+        manzil_number: int | None,
+        has_sajdah: bool | None,
+    ) -> Select[Any]:
         if revelation_type is not None:
             stmt = stmt.where(SurahModel.revelation_type == revelation_type.value)
         if juz_number is not None:
@@ -242,9 +361,82 @@ class PostgresQuranRepository(IQuranRepository):
             stmt = stmt.where(VerseModel.manzil_number == manzil_number)
         if has_sajdah is not None:
             stmt = stmt.where(VerseModel.is_sajdah == has_sajdah)
-        stmt = stmt.order_by(VerseModel.surah_number, VerseModel.verse_number)
+        return stmt.order_by(VerseModel.surah_number, VerseModel.verse_number)
+
+    async def get_verses_by_criteria(
+        self,
+        revelation_type: RevelationType | None = None,
+        juz_number: int | None = None,
+        hizb_number: int | None = None,
+        manzil_number: int | None = None,
+        has_sajdah: bool | None = None,
+    ) -> list[Verse]:
+        stmt = (
+            select(VerseModel)
+            .join(VerseModel.surah)
+            .options(contains_eager(VerseModel.surah))
+        )
+        stmt = self._apply_criteria(
+            stmt, revelation_type, juz_number, hizb_number, manzil_number, has_sajdah
+        )
+        result = await self._session.execute(stmt)
+        return self._rows_to_verses(result.scalars().all())
+
+    async def get_verse_previews_by_criteria(
+        self,
+        revelation_type: RevelationType | None = None,
+        juz_number: int | None = None,
+        hizb_number: int | None = None,
+        manzil_number: int | None = None,
+        has_sajdah: bool | None = None,
+    ) -> list[VersePreview]:
+        stmt = select(*self._PREVIEW_COLUMNS).join(
+            SurahModel, VerseModel.surah_number == SurahModel.id
+        )
+        stmt = self._apply_criteria(
+            stmt, revelation_type, juz_number, hizb_number, manzil_number, has_sajdah
+        )
         result = await self._session.execute(stmt)
-        return [self._model_to_verse(row[0], row[1]) for row in result.all()]
+        return self._rows_to_previews(result.tuples().all())
+
+    @staticmethod
+    def _apply_text_search(
+        stmt: Select[Any],
+        query: str,
+        surah_number: int | None,
+        case_sensitive: bool,
+    ) -> Select[Any]:
+        stripped = query.strip()
+        if " " in stripped and len(stripped) >= _MIN_TSQUERY_LENGTH and not case_sensitive:
+            # Long multi-word phrases go through the generated tsvector
+            # column (migration 0009): trigram lookup cost grows with
+            # pattern length, while the word-level GIN stays cheap.
+            # phraseto_tsquery keeps LIKE's in-order-adjacent semantics
+            # at word granularity. Short/single-word queries stay on the
+            # trigram path, which also matches substrings inside
+            # clitic-attached forms (e.g. فالحمد for الحمد).
+            stmt = stmt.where(
+                text(
+                    "verses.text_norm_tsv @@ phraseto_tsquery('simple', :ts_query)"
+                ).bindparams(ts_query=stripped)
+            )
+            if surah_number is not None:
+                stmt = stmt.where(VerseModel.surah_number == surah_number)
+            return stmt.order_by(VerseModel.surah_number, VerseModel.verse_number)
+
+        search_field = VerseModel.text_normalized_full
+        pattern = f"%{query}%"
+        if case_sensitive or query.lower() == query.upper():
+            # Caseless scripts (Arabic): LIKE is equivalent to ILIKE but
+            # maps directly onto the gin_trgm_ops index, so the planner
+            # runs a bitmap index scan instead of a sequential scan with
+            # per-row lower() rechecks.
+            stmt = stmt.where(search_field.like(pattern))
+        else:
+            stmt = stmt.where(search_field.ilike(pattern))
+        if surah_number is not None:
+            stmt = stmt.where(VerseModel.surah_number == surah_number)
+        return stmt.order_by(VerseModel.surah_number, VerseModel.verse_number)
 
     async def search_text(
         self,
@@ -252,42 +444,122 @@ class PostgresQuranRepository(IQuranRepository):
         surah_number: int | None = None,
         case_sensitive: bool = False,
     ) -> list[Verse]:
-        stmt = select(VerseModel, SurahModel).join(
+        stmt = (
+            select(VerseModel)
+            .join(VerseModel.surah)
+            .options(contains_eager(VerseModel.surah))
+        )
+        stmt = self._apply_text_search(stmt, query, surah_number, case_sensitive)
+        result = await self._session.execute(stmt)
+        return self._rows_to_verses(result.scalars().all())
+
+    async def search_text_previews(
+        self,
+        query: str,
+        surah_number: int | None = None,
+        case_sensitive: bool = False,
+    ) -> list[VersePreview]:
+        stmt = select(*self._PREVIEW_COLUMNS).join(
             SurahModel, VerseModel.surah_number == SurahModel.id
         )
-        search_field = VerseModel.text_normalized_full
-        if case_sensitive:
-            stmt = stmt.where(search_field.contains(query))
-        else:
-            stmt = stmt.where(search_field.ilike(f"%{query}%"))
-        if surah_number is not None:
-            stmt = stmt.where(VerseModel.surah_number == surah_number)
-        stmt = stmt.order_by(VerseModel.surah_number, VerseModel.verse_number)
+        stmt = self._apply_text_search(stmt, query, surah_number, case_sensitive)
         result = await self._session.execute(stmt)
-        return [self._model_to_verse(row[0], row[1]) for row in result.all()]
+        return self._rows_to_previews(result.tuples().all())
 
-    async def verify_integrity(self) -> IntegrityReport:
-        failed_verses: list[VerseLocation] = []
+    async def stream_verify_integrity(
+        self,
+        chunk_size: int = 1024,
+    ) -> AsyncIterator[SlimIntegrityReport]:
+        hasher = hashlib.sha256()
+        failed_bits = 0
         total_verses = 0
+        chunk_index = 0
 
         async for verse in self.stream_verses():
+            # Hash while streaming ("\n"-joined, matching verify_integrity).
+            if total_verses:
+                hasher.update(b"\n")
+            hasher.update(verse.content[ScriptType.UTHMANI].encode("utf-8"))
             total_verses += 1
             if not verse.verify_integrity():
-                failed_verses.append(verse.location)
+                failed_bits |= 1 << verse.location.global_index
+
+            if total_verses % chunk_size == 0:
+                yield SlimIntegrityReport(
+                    is_valid=failed_bits == 0,
+                    failed_bitmap=SlimIntegrityReport.pack_bitmap(failed_bits),
+                    total_verses=total_verses,
+                    chunk_index=chunk_index,
+                )
+                chunk_index += 1
 
-        all_text_stmt = select(VerseModel.text_uthmani).order_by(
-            VerseModel.surah_number, VerseModel.verse_number
+        yield SlimIntegrityReport(
+            is_valid=failed_bits == 0,
+            failed_bitmap=SlimIntegrityReport.pack_bitmap(failed_bits),
+            total_verses=total_verses,
+            chunk_index=chunk_index,
+            is_terminal=True,
+            actual_checksum=hasher.digest(),
+        )
+
+    async def verify_integrity(self) -> IntegrityReport:
+        # Verify in SQL: re-hashing every verse server-side means only
+        # (surah, verse, ok) triples cross the wire instead of every full
+        # row, and the corpus rollup never materializes the joined text
+        # in Python. right(checksum, 64) isolates the hex digest whether
+        # or not the stored value carries an "algorithm:" prefix.
+        # SET LOCAL scopes to the current transaction; the per-row hashing
+        # scan is parallel-eligible, so let Postgres fan it out.
+        await self._session.execute(text("SET LOCAL max_parallel_workers_per_gather = 4"))
+
+        computed = func.encode(
+            func.sha256(func.convert_to(VerseModel.text_uthmani, "UTF8")), "hex"
+        )
+        # Filter server-side: only mismatched locations cross the wire
+        # (normally zero rows), not one triple per verse.
+        per_verse_stmt = (
+            select(VerseModel.surah_number, VerseModel.verse_number)
+            .where(func.right(VerseModel.checksum, 64) != computed)
+            .order_by(VerseModel.surah_number, VerseModel.verse_number)
+        )
+        result = await self._session.execute(per_verse_stmt)
+        failed_verses = [
+            VerseLocation.get(surah_number, verse_number)
+            for surah_number, verse_number in result.all()
+        ]
+        total_verses = await self.get_verse_count()
+
+        rollup_stmt = select(
+            func.encode(
+                func.sha256(
+                    func.convert_to(
+                        func.string_agg(
+                            VerseModel.text_uthmani,
+                            aggregate_order_by(
+                                literal("\n"),
+                                VerseModel.surah_number,
+                                VerseModel.verse_number,
+                            ),
+                        ),
+                        "UTF8",
+                    )
+                ),
+                "hex",
+            ),
+            # Transaction timestamp rides along on the single rollup row,
+            # so checked_at reflects the snapshot the check actually saw.
+            func.now(),
         )
-        result = await self._session.execute(all_text_stmt)
-        all_text = "\n".join(row[0] for row in result.all())
-        actual_checksum = TextChecksum.compute(all_text)
+        rollup = await self._session.execute(rollup_stmt)
+        rollup_hex, checked_at = rollup.one()
+        actual_checksum = TextChecksum(algorithm="sha256", value=rollup_hex)
 
         return IntegrityReport(
             is_valid=len(failed_verses) == 0,
-            checked_at=datetime.utcnow(),
+            checked_at=checked_at,
             total_verses=total_verses,
             failed_verses=tuple(failed_verses),
-            expected_checksum="",
-            actual_checksum=actual_checksum.value,
+            expected_checksum=b"",
+            actual_checksum=bytes.fromhex(actual_checksum.value),
             details=f"Verified {total_verses} verses, {len(failed_verses)} failures",
         )
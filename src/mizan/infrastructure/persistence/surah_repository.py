@@ -4,6 +4,8 @@ PostgreSQL implementation of ISurahMetadataRepository.
 
 from __future__ import annotations
 
+from typing import ClassVar
+
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -17,9 +19,44 @@ from mizan.infrastructure.persistence.models import SurahModel
 class PostgresSurahMetadataRepository(ISurahMetadataRepository):
     """PostgreSQL implementation of ISurahMetadataRepository."""
 
+    # Surah metadata is fixed scholarly reference data — 114 rows that
+    # never change after ingestion — so the whole table is loaded once
+    # into immutable SurahMetadata values and cached at class level
+    # (repositories are per-request). Every lookup after the first is a
+    # dict/tuple read with no SQL and no ORM materialization.
+    _metadata_cache: ClassVar[dict[int, SurahMetadata] | None] = None
+    _meccan_cache: ClassVar[tuple[SurahMetadata, ...] | None] = None
+    _medinan_cache: ClassVar[tuple[SurahMetadata, ...] | None] = None
+
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
 
+    @classmethod
+    def clear_metadata_cache(cls) -> None:
+        """Drop the cached surah metadata (mainly for tests/ingestion)."""
+        cls._metadata_cache = None
+        cls._meccan_cache = None
+        cls._medinan_cache = None
+
+    async def _load_cache(self) -> dict[int, SurahMetadata]:
+        cls = type(self)
+        if cls._metadata_cache is None:
+            stmt = select(SurahModel).order_by(SurahModel.id)
+            result = await self._session.execute(stmt)
+            metadata = {m.id: self._model_to_metadata(m) for m in result.scalars().all()}
+            if not metadata:
+                # Not yet ingested — keep re-querying instead of pinning
+                # an empty table in the cache.
+                return metadata
+            cls._meccan_cache = tuple(
+                m for m in metadata.values() if m.revelation_type is RevelationType.MECCAN
+            )
+            cls._medinan_cache = tuple(
+                m for m in metadata.values() if m.revelation_type is RevelationType.MEDINAN
+            )
+            cls._metadata_cache = metadata
+        return cls._metadata_cache
+
     def _model_to_metadata(self, model: SurahModel) -> SurahMetadata:
         return SurahMetadata(
             number=model.id,
@@ -36,32 +73,24 @@ class PostgresSurahMetadataRepository(ISurahMetadataRepository):
         )
 
     async def get_metadata(self, surah_number: int) -> SurahMetadata:
-        stmt = select(SurahModel).where(SurahModel.id == surah_number)
-        result = await self._session.execute(stmt)
-        model = result.scalar_one_or_none()
-        if model is None:
+        metadata = (await self._load_cache()).get(surah_number)
+        if metadata is None:
             raise SurahNotFoundError(surah_number)
-        return self._model_to_metadata(model)
+        return metadata
 
     async def get_all_metadata(self) -> list[SurahMetadata]:
-        stmt = select(SurahModel).order_by(SurahModel.id)
-        result = await self._session.execute(stmt)
-        return [self._model_to_metadata(m) for m in result.scalars().all()]
+        return list((await self._load_cache()).values())
 
     async def get_meccan_surahs(self) -> list[SurahMetadata]:
-        stmt = (
-            select(SurahModel)
-            .where(SurahModel.revelation_type == RevelationType.MECCAN.value)
-            .order_by(SurahModel.id)
-        )
-        result = await self._session.execute(stmt)
-        return [self._model_to_metadata(m) for m in result.scalars().all()]
+        metadata = await self._load_cache()
+        cached = type(self)._meccan_cache
+        if cached is not None:
+            return list(cached)
+        return [m for m in metadata.values() if m.revelation_type is RevelationType.MECCAN]
 
     async def get_medinan_surahs(self) -> list[SurahMetadata]:
-        stmt = (
-            select(SurahModel)
-            .where(SurahModel.revelation_type == RevelationType.MEDINAN.value)
-            .order_by(SurahModel.id)
-        )
-        result = await self._session.execute(stmt)
-        return [self._model_to_metadata(m) for m in result.scalars().all()]
+        metadata = await self._load_cache()
+        cached = type(self)._medinan_cache
+        if cached is not None:
+            return list(cached)
+        return [m for m in metadata.values() if m.revelation_type is RevelationType.MEDINAN]
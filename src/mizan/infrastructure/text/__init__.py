@@ -2,8 +2,10 @@
 
 from mizan.infrastructure.text.entity_matcher import EntityVariantMatcher
 from mizan.infrastructure.text.normalizer import ArabicNormalizer
+from mizan.infrastructure.text.packed_corpus import PackedText
 
 __all__ = [
     "ArabicNormalizer",
     "EntityVariantMatcher",
+    "PackedText",
 ]
@@ -6,6 +6,35 @@ Implements the entity variant matching algorithm from Appendix G.
 
 from typing import Final
 
+# Tashkeel stripped before prefix comparison. Hoisted to module scope
+# (previously rebuilt as a frozenset inside every _strip_tashkeel call)
+# and compiled into a str.translate deletion table.
+_TASHKEEL_TABLE: Final[dict[int, int | None]] = str.maketrans(
+    "",
+    "",
+    "".join(
+        [
+            "\u064b",
+            "\u064c",
+            "\u064d",
+            "\u064e",
+            "\u064f",
+            "\u0650",
+            "\u0651",
+            "\u0652",
+            "\u0653",
+            "\u0654",
+            "\u0655",
+            "\u0670",
+        ]
+    ),
+)
+
+
+def _strip_tashkeel(text: str) -> str:
+    """Remove diacritical marks from text."""
+    return text.translate(_TASHKEEL_TABLE)
+
 
 class EntityVariantMatcher:
     """
@@ -70,6 +99,36 @@ class EntityVariantMatcher:
     # All prefixes combined
     ALL_PREFIXES: Final[frozenset[str]] = MATCHABLE_PREFIXES | COMBINED_PREFIXES
 
+    # Prefixes attachable to words carrying the definite article ال.
+    AL_PREFIXES: Final[tuple[str, ...]] = (
+        "لِل",
+        "لل",
+        "بِال",
+        "بال",
+        "وَال",
+        "وال",
+        "فَال",
+        "فال",
+        "كَال",
+        "كال",
+    )
+
+    # (prefix, tashkeel-stripped prefix) pairs and the longest-first
+    # prefix ordering, computed once at class definition instead of
+    # re-stripping/re-sorting per matcher instance or per extraction.
+    _MATCHABLE_CLEAN: Final[tuple[tuple[str, str], ...]] = tuple(
+        (p, _strip_tashkeel(p)) for p in MATCHABLE_PREFIXES
+    )
+    _COMBINED_CLEAN: Final[tuple[tuple[str, str], ...]] = tuple(
+        (p, _strip_tashkeel(p)) for p in COMBINED_PREFIXES
+    )
+    _AL_CLEAN: Final[tuple[tuple[str, str], ...]] = tuple(
+        (p, _strip_tashkeel(p)) for p in AL_PREFIXES
+    )
+    _ALL_PREFIXES_SORTED: Final[tuple[str, ...]] = tuple(
+        sorted(ALL_PREFIXES, key=len, reverse=True)
+    )
+
     def __init__(self, base_word: str) -> None:
         """
         Initialize matcher with a base word.
@@ -79,21 +138,19 @@ class EntityVariantMatcher:
         """
         self._base_word = base_word
         self._all_forms = self._generate_all_forms()
+        self._clean_forms = frozenset(_strip_tashkeel(f) for f in self._all_forms)
 
     def _generate_all_forms(self) -> frozenset[str]:
         """Generate all possible prefixed forms of the base word."""
         forms: set[str] = {self._base_word}
 
         # Add single prefix forms
-        for prefix in self.MATCHABLE_PREFIXES:
-            # Strip tashkeel from prefix for matching
-            clean_prefix = self._strip_tashkeel(prefix)
+        for prefix, clean_prefix in self._MATCHABLE_CLEAN:
             forms.add(clean_prefix + self._base_word)
             forms.add(prefix + self._base_word)
 
         # Add combined prefix forms
-        for prefix in self.COMBINED_PREFIXES:
-            clean_prefix = self._strip_tashkeel(prefix)
+        for prefix, clean_prefix in self._COMBINED_CLEAN:
             forms.add(clean_prefix + self._base_word)
             forms.add(prefix + self._base_word)
 
@@ -101,33 +158,12 @@ class EntityVariantMatcher:
         if self._base_word.startswith("ال") or self._base_word.startswith("ٱل"):
             # Words with ال can also have prefixes attached differently
             base_without_al = self._base_word[2:]  # Remove ال
-            for prefix in ["لِل", "لل", "بِال", "بال", "وَال", "وال", "فَال", "فال", "كَال", "كال"]:
-                clean = self._strip_tashkeel(prefix)
-                forms.add(clean + base_without_al)
+            for prefix, clean_prefix in self._AL_CLEAN:
+                forms.add(clean_prefix + base_without_al)
                 forms.add(prefix + base_without_al)
 
         return frozenset(forms)
 
-    def _strip_tashkeel(self, text: str) -> str:
-        """Remove diacritical marks from text."""
-        TASHKEEL = frozenset(
-            [
-                "\u064b",
-                "\u064c",
-                "\u064d",
-                "\u064e",
-                "\u064f",
-                "\u0650",
-                "\u0651",
-                "\u0652",
-                "\u0653",
-                "\u0654",
-                "\u0655",
-                "\u0670",
-            ]
-        )
-        return "".join(c for c in text if c not in TASHKEEL)
-
     def matches(self, word: str) -> bool:
         """
         Check if a word matches any form of the base word.
@@ -143,9 +179,7 @@ class EntityVariantMatcher:
             return True
 
         # Try without tashkeel
-        clean_word = self._strip_tashkeel(word)
-        clean_forms = {self._strip_tashkeel(f) for f in self._all_forms}
-        return clean_word in clean_forms
+        return _strip_tashkeel(word) in self._clean_forms
 
     def get_all_forms(self) -> frozenset[str]:
         """Get all known forms of this word."""
@@ -169,13 +203,14 @@ class EntityVariantMatcher:
         if not self.matches(word):
             return None
 
-        # Check each prefix
-        for prefix in sorted(self.ALL_PREFIXES, key=len, reverse=True):
-            clean_prefix = self._strip_tashkeel(prefix)
+        # Check each prefix, longest first
+        clean_base = _strip_tashkeel(self._base_word)
+        for prefix in self._ALL_PREFIXES_SORTED:
+            clean_prefix = _strip_tashkeel(prefix)
             if word.startswith(prefix) or word.startswith(clean_prefix):
                 actual_prefix = prefix if word.startswith(prefix) else clean_prefix
                 remainder = word[len(actual_prefix) :]
-                if self._strip_tashkeel(remainder) == self._strip_tashkeel(self._base_word):
+                if _strip_tashkeel(remainder) == clean_base:
                     return (actual_prefix, remainder)
 
         # No prefix - exact match
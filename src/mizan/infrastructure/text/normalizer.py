@@ -9,6 +9,48 @@ from typing import Final
 from mizan.domain.enums import NormalizationLevel
 
 
+def _build_level_tables(
+    tashkeel: frozenset[str],
+    hamza_map: dict[str, str],
+    alif_map: dict[str, str],
+    ya_map: dict[str, str],
+    full_strip: str,
+) -> dict[NormalizationLevel, dict[int, int | None]]:
+    """Compose one str.translate table per normalization level.
+
+    Each table is the functional composition of every pass up to that
+    level, so a single translate() call reproduces the sequential
+    pipeline exactly (e.g. at ALIF_UNIFIED the hamza pass has already
+    turned أ into ء, so the alif mapping for أ never fires — the
+    composed table preserves that ordering).
+    """
+    table: dict[int, int | None] = {ord(c): None for c in tashkeel}
+    tables = {
+        NormalizationLevel.NONE: {},
+        NormalizationLevel.TASHKEEL_REMOVED: dict(table),
+    }
+
+    def apply(mapping: dict[str, str]) -> None:
+        # Rewrite the outputs of earlier passes first, then add inputs
+        # the earlier passes left untouched.
+        for src, out in table.items():
+            if out is not None and chr(out) in mapping:
+                table[src] = ord(mapping[chr(out)])
+        for variant, replacement in mapping.items():
+            table.setdefault(ord(variant), ord(replacement))
+
+    apply(hamza_map)
+    tables[NormalizationLevel.HAMZA_UNIFIED] = dict(table)
+    apply(alif_map)
+    tables[NormalizationLevel.ALIF_UNIFIED] = dict(table)
+    apply(ya_map)
+    tables[NormalizationLevel.YA_UNIFIED] = dict(table)
+    for c in full_strip:
+        table[ord(c)] = None
+    tables[NormalizationLevel.FULL] = table
+    return tables
+
+
 class ArabicNormalizer:
     """
     Arabic text normalizer with progressive normalization levels.
@@ -113,6 +155,32 @@ class ArabicNormalizer:
         ]
     )
 
+    # Deletion tables for str.translate, built once at class definition.
+    # A single translate() call strips every listed codepoint in one
+    # C-level pass over the string, replacing the per-character Python
+    # filter loops (and their per-call allocations).
+    _TASHKEEL_TABLE: Final[dict[int, int | None]] = str.maketrans(
+        "", "", "".join(TASHKEEL)
+    )
+
+    # One fused translate table per level (composition of all passes up
+    # to that level) — normalize() is a single C-level pass instead of
+    # up to sixteen sequential scans/reallocations at FULL.
+    _LEVEL_TABLES: Final[dict[NormalizationLevel, dict[int, int | None]]] = (
+        _build_level_tables(
+            TASHKEEL,
+            HAMZA_MAP,
+            ALIF_MAP,
+            YA_MAP,
+            TATWEEL + "".join(SMALL_LETTERS) + "".join(WAQF_SIGNS),
+        )
+    )
+
+    # Arabic letters kept by strip_non_letters (includes Alif Wasla).
+    ARABIC_LETTERS: Final[frozenset[str]] = frozenset(
+        "ابتثجحخدذرزسشصضطظعغفقكلمنهويءآأؤإئى\u0671"
+    )
+
     def normalize(
         self,
         text: str,
@@ -130,82 +198,18 @@ class ArabicNormalizer:
         """
         if level == NormalizationLevel.NONE:
             return text
-
-        # Level 1: Remove tashkeel
-        if self._is_at_least(level, NormalizationLevel.TASHKEEL_REMOVED):
-            text = self._remove_tashkeel(text)
-
-        # Level 2: Unify Hamza
-        if self._is_at_least(level, NormalizationLevel.HAMZA_UNIFIED):
-            text = self._unify_hamza(text)
-
-        # Level 3: Unify Alif
-        if self._is_at_least(level, NormalizationLevel.ALIF_UNIFIED):
-            text = self._unify_alif(text)
-
-        # Level 4: Unify Ya
-        if self._is_at_least(level, NormalizationLevel.YA_UNIFIED):
-            text = self._unify_ya(text)
-
-        # Level 5 (FULL): Additional cleanup
-        if level == NormalizationLevel.FULL:
-            text = self._full_normalize(text)
-
-        return text
-
-    def _is_at_least(
-        self,
-        current: NormalizationLevel,
-        threshold: NormalizationLevel,
-    ) -> bool:
-        """Check whether the current level includes the threshold level."""
-        return self.LEVEL_ORDER[current] >= self.LEVEL_ORDER[threshold]
-
-    def _remove_tashkeel(self, text: str) -> str:
-        """Remove all diacritical marks."""
-        return "".join(c for c in text if c not in self.TASHKEEL)
-
-    def _unify_hamza(self, text: str) -> str:
-        """Unify Hamza variants to bare Hamza."""
-        for variant, replacement in self.HAMZA_MAP.items():
-            text = text.replace(variant, replacement)
-        return text
-
-    def _unify_alif(self, text: str) -> str:
-        """Unify Alif variants to plain Alif."""
-        for variant, replacement in self.ALIF_MAP.items():
-            text = text.replace(variant, replacement)
-        return text
-
-    def _unify_ya(self, text: str) -> str:
-        """Unify Ya variants to plain Ya."""
-        for variant, replacement in self.YA_MAP.items():
-            text = text.replace(variant, replacement)
-        return text
-
-    def _full_normalize(self, text: str) -> str:
-        """Apply full normalization (all transformations)."""
-        # Remove tatweel
-        text = text.replace(self.TATWEEL, "")
-
-        # Remove small letters
-        text = "".join(c for c in text if c not in self.SMALL_LETTERS)
-
-        # Remove waqf signs
-        text = "".join(c for c in text if c not in self.WAQF_SIGNS)
-
-        return text
+        return text.translate(self._LEVEL_TABLES[level])
 
     def remove_tashkeel_only(self, text: str) -> str:
         """Remove only tashkeel (convenience method)."""
-        return self._remove_tashkeel(text)
+        return text.translate(self._TASHKEEL_TABLE)
 
     def strip_non_letters(self, text: str) -> str:
         """Remove everything except Arabic letters."""
-        ARABIC_LETTERS = frozenset(
-            "ابتثجحخدذرزسشصضطظعغفقكلمنهويءآأؤإئى\u0671"  # Alif Wasla
-        )
-        return "".join(c for c in text if c in ARABIC_LETTERS)
+        # Keep-filter (unbounded delete set), so translate does not apply;
+        # the letter set is hoisted to a class constant instead of being
+        # rebuilt on every call.
+        return "".join(c for c in text if c in self.ARABIC_LETTERS)
 
     def normalize_for_search(self, text: str) -> str:
         """
@@ -0,0 +1,75 @@
+"""
+Packed text storage for bulk in-process corpus scans.
+
+Storing 6,236 verses as individual Python ``str`` objects costs ~49 bytes of
+object header per string plus pointer-chasing on every scan. For bulk
+operations (offline eval indexes, corpus-wide integrity sweeps) an Arrow-style
+layout — one contiguous UTF-8 blob plus an offset table — is far more
+cache-friendly and allows byte-level regex scans without decoding at all.
+
+This is an infrastructure utility for load/scan phases only; the ``Verse``
+entity keeps its ``dict[ScriptType, str]`` contract, since API verses are
+hydrated per-request from PostgreSQL where this layout buys nothing.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable, Iterator
+
+
+class PackedText:
+    """
+    Immutable sequence of texts packed into one contiguous UTF-8 blob.
+
+    Texts are concatenated into a single ``bytes`` buffer with an int32-style
+    offset table (length N+1), so item ``i`` lives at
+    ``blob[offsets[i]:offsets[i + 1]]`` and is decoded on demand.
+    """
+
+    __slots__ = ("_blob", "_offsets")
+
+    def __init__(self, texts: Iterable[str]) -> None:
+        offsets = array("l", [0])
+        chunks: list[bytes] = []
+        total = 0
+        for text in texts:
+            encoded = text.encode("utf-8")
+            chunks.append(encoded)
+            total += len(encoded)
+            offsets.append(total)
+        self._blob = b"".join(chunks)
+        self._offsets = offsets
+
+    @property
+    def blob(self) -> bytes:
+        """The raw UTF-8 blob, for byte-level scans (e.g. bytes regex)."""
+        return self._blob
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index: int) -> str:
+        """Decode text ``index`` on demand."""
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(f"PackedText index out of range: {index}")
+        return self._blob[self._offsets[index] : self._offsets[index + 1]].decode("utf-8")
+
+    def get_bytes(self, index: int) -> bytes:
+        """Raw UTF-8 bytes of text ``index`` — no decode, zero-copy slice."""
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(f"PackedText index out of range: {index}")
+        return self._blob[self._offsets[index] : self._offsets[index + 1]]
+
+    def __iter__(self) -> Iterator[str]:
+        blob = self._blob
+        offsets = self._offsets
+        for i in range(len(self)):
+            yield blob[offsets[i] : offsets[i + 1]].decode("utf-8")
+
+    def __repr__(self) -> str:
+        return f"PackedText(texts={len(self)}, bytes={len(self._blob)})"
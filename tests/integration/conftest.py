@@ -15,7 +15,11 @@ from fastapi.testclient import TestClient
 from httpx import ASGITransport, AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from mizan.api.dependencies import get_db_session, get_redis_cache
+from mizan.api.dependencies import (
+    get_db_session,
+    get_readonly_db_session,
+    get_redis_cache,
+)
 from mizan.api.main import create_app
 from mizan.infrastructure.cache.redis_cache import RedisCache
 from mizan.infrastructure.config import get_settings
@@ -68,6 +72,7 @@ def app():
     settings.init_db_on_startup = False
     application = create_app()
     application.dependency_overrides[get_db_session] = _mock_session_dep
+    application.dependency_overrides[get_readonly_db_session] = _mock_session_dep
     application.dependency_overrides[get_redis_cache] = _mock_cache_dep
     yield application
     application.dependency_overrides.clear()
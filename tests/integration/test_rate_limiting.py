@@ -20,7 +20,11 @@ from slowapi import Limiter
 from slowapi.util import get_remote_address
 
 import mizan.api.limiters as limiters_module
-from mizan.api.dependencies import get_db_session, get_redis_cache
+from mizan.api.dependencies import (
+    get_db_session,
+    get_readonly_db_session,
+    get_redis_cache,
+)
 from mizan.api.main import create_app
 from mizan.infrastructure.config import get_settings
 
@@ -48,6 +52,7 @@ def rate_limited_client(monkeypatch):
     # create_app() pinned app.state.limiter to the (already patched) module value.
     app.state.limiter = test_limiter
     app.dependency_overrides[get_db_session] = _passthrough_session
+    app.dependency_overrides[get_readonly_db_session] = _passthrough_session
     app.dependency_overrides[get_redis_cache] = _passthrough_cache
 
     # Reset the in-memory storage so the counter starts at zero.
@@ -1,5 +1,7 @@
 """Unit tests for domain enumerations."""
 
+import pytest
+
 from mizan.domain.enums import (
     AbjadSystem,
     AnalysisType,
@@ -46,6 +48,16 @@ class TestScriptType:
         """Test Uthmani Minimal enum value."""
         assert ScriptType.UTHMANI_MINIMAL.value == "uthmani_min"
 
+    def test_from_str_returns_member(self):
+        """Test fast lookup matches the enum constructor."""
+        for member in ScriptType:
+            assert ScriptType.from_str(member.value) is member
+
+    def test_from_str_rejects_unknown(self):
+        """Test fast lookup raises ValueError like the constructor."""
+        with pytest.raises(ValueError):
+            ScriptType.from_str("not_a_script")
+
 
 class TestQiraatType:
     """Tests for QiraatType enum."""
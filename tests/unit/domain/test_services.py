@@ -81,6 +81,13 @@ class TestLetterCounter:
         """Test counting non-Arabic text."""
         assert letter_counter.count_letters("Hello World") == 0
 
+    def test_count_letters_bulk(self, letter_counter):
+        """Test bulk counting matches per-text counting."""
+        texts = ["كتاب", "مَدْرَسَة", "", "Hello"]
+        assert letter_counter.count_letters_bulk(texts) == [
+            letter_counter.count_letters(text) for text in texts
+        ]
+
 
 class TestAbjadCalculator:
     """Tests for AbjadCalculator service."""
@@ -79,6 +79,21 @@ class TestVerseLocation:
         with pytest.raises(ValueError, match="must be integers"):
             VerseLocation.from_string("two:255")
 
+    def test_from_strings_bulk(self):
+        """Test bulk parsing matches per-string parsing."""
+        raw = ["1:1", "2:255", " 114:6 "]
+        assert VerseLocation.from_strings(raw) == [VerseLocation.from_string(r) for r in raw]
+
+    def test_location_array_sort_roundtrip(self):
+        """Test packed array sorts in Mushaf order and validates."""
+        from mizan.domain.value_objects.verse_location import VerseLocationArray
+
+        locations = [VerseLocation(114, 6), VerseLocation(1, 7), VerseLocation(2, 255)]
+        arr = VerseLocationArray.from_locations(locations)
+        arr.sort()
+        assert arr.validate()
+        assert arr.to_objects() == sorted(locations)
+
     def test_immutability(self):
         """Test that VerseLocation is immutable."""
         loc = VerseLocation(surah_number=1, verse_number=1)
@@ -141,6 +156,33 @@ class TestVerseLocation:
         loc = VerseLocation(surah_number=1, verse_number=1)
         assert loc.previous_verse() is None
 
+    def test_global_index_endpoints(self):
+        """Test global ayah index for first and last verses."""
+        assert VerseLocation(surah_number=1, verse_number=1).global_index == 0
+        assert VerseLocation(surah_number=114, verse_number=6).global_index == 6235
+
+    def test_from_global_index_roundtrip(self):
+        """Test from_global_index inverts global_index."""
+        for loc in (VerseLocation(2, 255), VerseLocation(9, 1), VerseLocation(114, 6)):
+            assert VerseLocation.from_global_index(loc.global_index) == loc
+
+    def test_from_global_index_out_of_range(self):
+        """Test from_global_index rejects out-of-range indexes."""
+        with pytest.raises(ValueError):
+            VerseLocation.from_global_index(6236)
+
+    def test_pack_word_roundtrip(self):
+        """Test unpack_word inverts pack_word."""
+        loc = VerseLocation(surah_number=2, verse_number=255)
+        assert VerseLocation.unpack_word(loc.pack_word(7)) == (loc, 7)
+        assert VerseLocation.unpack_word(loc.pack_word()) == (loc, 0)
+
+    def test_pack_word_rejects_oversized_word(self):
+        """Test pack_word rejects word numbers beyond 8 bits."""
+        loc = VerseLocation(surah_number=1, verse_number=1)
+        with pytest.raises(ValueError):
+            loc.pack_word(256)
+
 
 class TestTextChecksum:
     """Tests for TextChecksum value object."""
@@ -157,6 +199,11 @@ class TestTextChecksum:
         assert checksum.algorithm == "sha512"
         assert len(checksum.value) == 128  # SHA512 produces 128 hex chars
 
+    def test_compute_bulk_matches_joined_compute(self):
+        """Test compute_bulk equals compute over the joined text."""
+        chunks = ["بسم الله", "الرحمن", "الرحيم"]
+        assert TextChecksum.compute_bulk(chunks) == TextChecksum.compute("\n".join(chunks))
+
     def test_compute_arabic_text(self, basmalah_simple):
         """Test checksum of Arabic text."""
         checksum = TextChecksum.compute(basmalah_simple)